@@ -7,10 +7,62 @@ output files and generates a simple markdown summary.
 """
 
 import argparse
+import concurrent.futures
+import os
 import sys
-import re
+try:
+    # Optional linear-time DFA engine; matches release the GIL so the
+    # --jobs thread pool scales across cores. Same API as stdlib re.
+    import re2 as re
+except ImportError:
+    import re
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class JobResult(NamedTuple):
+    """Parsed status of a single PBS output file."""
+
+    file: str
+    status: str
+    cycle: str
+    error: Optional[str]
+    size: int
+
+
+# Precompiled patterns reused across files (avoids per-file recompilation)
+_CYCLE_RE = re.compile(r'(gfs|gdas)\.(\d{8})\.(\d{2})')
+
+# Single alternation covering every status indicator so the file content
+# is scanned once; the matched group tells us which indicator hit.
+_STATUS_RE = re.compile(
+    r'(Job completed|COMPLETED)'
+    r'|(Job failed|FAILED|ERROR)'
+    r'|(PBS Job)'
+    r'|Exit Status:\s*(\d+)'
+)
+
+# Pulls whole offending lines out of the content in one pass, without
+# splitting into lines or upper-casing each of them.
+_ERR_LINE_RE = re.compile(
+    r'^.*(?:ERROR|FAILED|EXCEPTION).*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Only the tail of large job logs is inspected; the PBS epilogue (and
+# thus "Exit Status") sits at the end of the output.
+_TAIL_BYTES = 64 * 1024
+
+# Markdown status icons, built once instead of per report section
+_STATUS_ICONS = {
+    'completed': '✅',
+    'failed': '❌',
+    'running': '⏳',
+    'error': '🔥',
+    'unknown': '❓'
+}
 
 
 def find_pbs_output_files(directory: str) -> list:
@@ -18,136 +70,163 @@ def find_pbs_output_files(directory: str) -> list:
     output_files = []
     dir_path = Path(directory)
 
-    if not dir_path.exists():
+    # PBS output files typically have pattern: jobname.o<jobid>; a
+    # plain rfind + isdigit check on the suffix replaces the regex, and
+    # a missing directory surfaces as OSError rather than a pre-check
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                idx = entry.name.rfind('.o')
+                if idx != -1 and entry.name[idx + 2:].isdigit():
+                    output_files.append(dir_path / entry.name)
+    except OSError:
         return output_files
 
-    # PBS output files typically have pattern: jobname.o<jobid>
-    for file_path in dir_path.glob("*.o*"):
-        if re.match(r".*\.o\d+$", file_path.name):
-            output_files.append(file_path)
-
     return sorted(output_files)
 
 
-def parse_pbs_output_file(file_path: Path) -> dict:
+def parse_pbs_output_file(file_path: Path) -> JobResult:
     """Parse a PBS output file to determine job status and cycle info."""
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            # Size from the already-open descriptor; no extra stat
+            size = os.fstat(f.fileno()).st_size
+            # Large logs: only the tail holds the status indicators, so
+            # keep memory constant regardless of log size.
+            if size > _TAIL_BYTES:
+                f.seek(-_TAIL_BYTES, os.SEEK_END)
+            content = f.read().decode('utf-8', errors='replace')
     except Exception as e:
-        return {
-            'file': file_path.name,
-            'status': 'error',
-            'error': f"Could not read file: {e}",
-            'cycle': 'unknown'
-        }
+        return JobResult(
+            file=file_path.name,
+            status='error',
+            cycle='unknown',
+            error=f"Could not read file: {e}",
+            size=0,
+        )
 
     # Extract cycle name from filename or content
-    cycle_match = re.search(r'(gfs|gdas)\.(\d{8})\.(\d{2})', str(file_path))
+    cycle_match = _CYCLE_RE.search(str(file_path))
     if cycle_match:
         cycle = (f"{cycle_match.group(1)}.{cycle_match.group(2)}."
                  f"{cycle_match.group(3)}")
     else:
         cycle = "unknown"
 
-    # Determine job status based on content
+    # Determine job status based on content, walking it a single time
     status = "unknown"
     error_info = None
 
-    # Check for common completion indicators
-    if "Job completed" in content or "COMPLETED" in content:
+    completed_hit = False
+    failed_hit = False
+    pbs_job_hit = False
+    exit_code = None
+
+    for match in _STATUS_RE.finditer(content):
+        group = match.lastindex
+        if group == 1:
+            completed_hit = True
+        elif group == 2:
+            failed_hit = True
+        elif group == 3:
+            pbs_job_hit = True
+        elif group == 4:
+            exit_code = int(match.group(4))
+
+    if completed_hit:
         status = "completed"
-    elif "Job failed" in content or "FAILED" in content or "ERROR" in content:
+    elif failed_hit:
         status = "failed"
-        # Try to extract error information
-        error_lines = []
-        for line in content.split('\n'):
-            keywords = ["ERROR", "FAILED", "EXCEPTION"]
-            if any(keyword in line.upper() for keyword in keywords):
-                error_lines.append(line.strip())
+        # First 3 error lines; finditer streams over the content and
+        # stops as soon as enough lines are collected
+        error_lines = [
+            match.group(0).strip()
+            for match, _ in zip(_ERR_LINE_RE.finditer(content), range(3))
+        ]
         if error_lines:
-            error_info = "; ".join(error_lines[:3])  # First 3 error lines
-    elif content.strip() == "":
+            error_info = "; ".join(error_lines)
+    elif not content or content.isspace():
         status = "running"  # Empty file usually means job is still running
     else:
         # Check for PBS job completion messages
-        if "PBS Job" in content:
-            if "Exit Status" in content:
-                exit_match = re.search(r"Exit Status:\s*(\d+)", content)
-                if exit_match:
-                    exit_code = int(exit_match.group(1))
-                    status = "completed" if exit_code == 0 else "failed"
-                    if exit_code != 0:
-                        error_info = f"Exit code: {exit_code}"
+        if pbs_job_hit:
+            if exit_code is not None:
+                status = "completed" if exit_code == 0 else "failed"
+                if exit_code != 0:
+                    error_info = f"Exit code: {exit_code}"
         else:
             # If file has content but no clear indicators, assume running
-            status = "running" if len(content.strip()) < 100 else "completed"
-
-    return {
-        'file': file_path.name,
-        'status': status,
-        'cycle': cycle,
-        'error': error_info,
-        'size': file_path.stat().st_size if file_path.exists() else 0
-    }
-
-
-def generate_status_summary(job_results: list, output_file: str) -> None:
-    """Generate a markdown summary of job statuses."""
-
-    # Count statuses
-    completed = len([j for j in job_results if j['status'] == 'completed'])
-    failed = len([j for j in job_results if j['status'] == 'failed'])
-    running = len([j for j in job_results if j['status'] == 'running'])
-    error = len([j for j in job_results if j['status'] == 'error'])
-    unknown = len([j for j in job_results if j['status'] == 'unknown'])
-
-    with open(output_file, 'w') as f:
-        f.write("# PBS Job Status Summary\n\n")
-        f.write(f"Generated: {datetime.now().isoformat()}\n\n")
-
-        f.write("## Summary\n\n")
-        f.write(f"- Total jobs: {len(job_results)}\n")
-        f.write(f"- Completed: {completed}\n")
-        f.write(f"- Failed: {failed}\n")
-        f.write(f"- Running: {running}\n")
-        f.write(f"- Error (file read issues): {error}\n")
-        f.write(f"- Unknown status: {unknown}\n\n")
-
-        if job_results:
-            f.write("## Job Details\n\n")
-
-            # Group by status
-            statuses = ['completed', 'failed', 'running', 'error', 'unknown']
-            for status in statuses:
-                jobs_with_status = [j for j in job_results
-                                    if j['status'] == status]
-                if jobs_with_status:
-                    f.write(f"### {status.title()} Jobs\n\n")
-
-                    sorted_jobs = sorted(jobs_with_status,
-                                         key=lambda x: x['cycle'])
-                    for job in sorted_jobs:
-                        status_icon = {
-                            'completed': '✅',
-                            'failed': '❌',
-                            'running': '⏳',
-                            'error': '🔥',
-                            'unknown': '❓'
-                        }.get(status, '❓')
-
-                        cycle_name = job['cycle']
-                        file_name = job['file']
-                        f.write(f"- {status_icon} **{cycle_name}** "
-                                f"({file_name})")
-
-                        if job.get('error'):
-                            f.write(f" - Error: {job['error']}")
-
-                        f.write(f" - Size: {job['size']} bytes")
-                        f.write("\n")
-
-                    f.write("\n")
+            status = "running" if len(content) < 100 else "completed"
+
+    return JobResult(
+        file=file_path.name,
+        status=status,
+        cycle=cycle,
+        error=error_info,
+        size=size,
+    )
+
+
+def generate_status_summary(job_results, output_file: str) -> dict:
+    """
+    Generate a markdown summary of job statuses.
+
+    Args:
+        job_results: Iterable of JobResult tuples; consumed in a
+            single pass so callers may stream a generator
+        output_file: Path to write the markdown summary
+
+    Returns:
+        Dict mapping each status to its list of job results
+    """
+    # Count and group statuses in a single pass
+    statuses = ['completed', 'failed', 'running', 'error', 'unknown']
+    groups = {status: [] for status in statuses}
+    total = 0
+    for job in job_results:
+        groups.setdefault(job.status, []).append(job)
+        total += 1
+
+    # Accumulate the report in memory and emit it with a single write
+    parts = []
+    parts.append("# PBS Job Status Summary\n\n")
+    parts.append(f"Generated: {datetime.now().isoformat()}\n\n")
+
+    parts.append("## Summary\n\n")
+    parts.append(f"- Total jobs: {total}\n")
+    parts.append(f"- Completed: {len(groups['completed'])}\n")
+    parts.append(f"- Failed: {len(groups['failed'])}\n")
+    parts.append(f"- Running: {len(groups['running'])}\n")
+    parts.append(f"- Error (file read issues): {len(groups['error'])}\n")
+    parts.append(f"- Unknown status: {len(groups['unknown'])}\n\n")
+
+    if total:
+        parts.append("## Job Details\n\n")
+
+        for status in statuses:
+            jobs_with_status = groups[status]
+            if jobs_with_status:
+                parts.append(f"### {status.title()} Jobs\n\n")
+
+                status_icon = _STATUS_ICONS[status]
+
+                sorted_jobs = sorted(jobs_with_status,
+                                     key=attrgetter('cycle'))
+                for job in sorted_jobs:
+                    parts.append(f"- {status_icon} **{job.cycle}** "
+                                 f"({job.file})")
+
+                    if job.error:
+                        parts.append(f" - Error: {job.error}")
+
+                    parts.append(f" - Size: {job.size} bytes")
+                    parts.append("\n")
+
+                parts.append("\n")
+
+    Path(output_file).write_text("".join(parts))
+
+    return groups
 
 
 def main():
@@ -170,6 +249,13 @@ def main():
         action="store_true",
         help="Enable verbose output"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker threads for parsing output files "
+             "(default: 1)"
+    )
 
     args = parser.parse_args()
 
@@ -183,25 +269,32 @@ def main():
     if args.verbose:
         print(f"Found {len(output_files)} PBS output files")
 
-    # Parse each file
-    job_results = []
-    for output_file in output_files:
-        if args.verbose:
-            print(f"Parsing {output_file.name}...")
-
-        result = parse_pbs_output_file(output_file)
-        job_results.append(result)
-
-    # Generate summary
-    generate_status_summary(job_results, args.output)
+    # Parse each file, streaming the results straight into the summary
+    # grouping so no flat list of all jobs is ever held. Files are
+    # independent, so parsing can be fanned out across threads while
+    # executor.map preserves ordering.
+    def iter_results():
+        for output_file in output_files:
+            if args.verbose:
+                print(f"Parsing {output_file.name}...")
+
+            yield parse_pbs_output_file(output_file)
+
+    if args.jobs > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=args.jobs
+        ) as executor:
+            groups = generate_status_summary(
+                executor.map(parse_pbs_output_file, output_files),
+                args.output,
+            )
+    else:
+        groups = generate_status_summary(iter_results(), args.output)
 
     # Print simple summary to console
-    completed = len([j for j in job_results if j['status'] == 'completed'])
-    failed = len([j for j in job_results if j['status'] == 'failed'])
-    running = len([j for j in job_results if j['status'] == 'running'])
-
-    print(f"PBS Job Status: {completed} completed, {failed} failed, "
-          f"{running} running")
+    print(f"PBS Job Status: {len(groups['completed'])} completed, "
+          f"{len(groups['failed'])} failed, "
+          f"{len(groups['running'])} running")
     print(f"Detailed report written to: {Path(args.output).resolve()}")
 
 
@@ -9,24 +9,84 @@ indicators, generating a markdown summary report.
 import os
 import sys
 import argparse
-import glob
+import concurrent.futures
+import fnmatch
+import functools
+import mmap
+from operator import itemgetter
 from typing import Dict, List, Tuple
-import re
+try:
+    # Optional linear-time DFA engine; matches release the GIL so the
+    # --jobs thread pool scales across cores. Same API as stdlib re.
+    import re2 as re
+except ImportError:
+    import re
+
+# Precompiled filename pattern (avoids per-file recompilation)
+# Matches both "3dvar_<cycle_type>.<date>.<hour>.<job_id>.out" and the
+# job-id-less "3dvar_<cycle_type>.<date>.<hour>.out" in a single scan.
+_FN_RE = re.compile(r"3dvar_(\w+)\.(\d{8})\.(\d{2})(?:\.\d+)?\.out$")
+
+# All static failure indicators in one alternation so the output file
+# content is scanned once; the matched group selects the detail text.
+# Bytes patterns so the scan runs directly over the mapped file without
+# decoding it first.
+_FAIL_RE = re.compile(
+    rb"(3DVAR failed for)|(Error:)|(SLURM: job.*?CANCELLED)",
+    re.DOTALL,
+)
+_FAIL_DETAILS = {
+    1: "Found failure message in output",
+    2: "Found error messages in output",
+    3: "Job was cancelled by SLURM",
+}
 
 
 def find_job_output_files(cycle_output_dir: str, pattern: str) -> List[str]:
     """
     Find all job output files matching the given pattern.
 
+    Walks the tree level by level with os.scandir, which reports the
+    entry type from the directory listing itself and avoids the extra
+    stat() per match that glob.glob performs.
+
     Args:
         cycle_output_dir: Root directory to search
-        pattern: Glob pattern for output files
+        pattern: Glob pattern for output files (one component per
+            directory level, e.g. "gdas.202402*/*/3dvar_*.out")
 
     Returns:
         List of matching file paths
     """
-    search_pattern = os.path.join(cycle_output_dir, pattern)
-    return glob.glob(search_pattern)
+    parts = [part for part in pattern.split("/") if part]
+    matches = [cycle_output_dir]
+    for depth, part in enumerate(parts):
+        want_dir = depth < len(parts) - 1
+        next_matches = []
+        for base in matches:
+            try:
+                with os.scandir(base) as entries:
+                    for entry in entries:
+                        if not fnmatch.fnmatch(entry.name, part):
+                            continue
+                        if want_dir and not entry.is_dir():
+                            continue
+                        next_matches.append(
+                            os.path.join(base, entry.name)
+                        )
+            except OSError:
+                continue
+        matches = next_matches
+    return matches
+
+
+@functools.lru_cache(maxsize=None)
+def _extract_cycle_info_cached(basename: str) -> Tuple[str, str, str]:
+    """Extract cycle info from a basename, memoized per basename."""
+    match = _FN_RE.match(basename)
+    if match:
+        return match.groups()
+    return ("unknown", "unknown", "unknown")
 
 
 def extract_cycle_info(filename: str) -> Tuple[str, str, str]:
@@ -39,50 +99,56 @@ def extract_cycle_info(filename: str) -> Tuple[str, str, str]:
     Returns:
         Tuple of (cycle_type, date, hour)
     """
-    basename = os.path.basename(filename)
-    # Pattern: 3dvar_<cycle_type>.<date>.<hour>.<job_id>.out
-    match = re.match(r"3dvar_(\w+)\.(\d{8})\.(\d{2})\.\d+\.out", basename)
-    if match:
-        return match.groups()
-    # Fallback pattern without job ID
-    match = re.match(r"3dvar_(\w+)\.(\d{8})\.(\d{2})\.out", basename)
-    if match:
-        return match.groups()
-    return ("unknown", "unknown", "unknown")
+    return _extract_cycle_info_cached(os.path.basename(filename))
 
 
-def check_job_success(output_file: str) -> Tuple[bool, str]:
+def check_job_success(
+    output_file: str, cycle_name: str = None
+) -> Tuple[bool, str]:
     """
     Check if a job completed successfully by examining its output file.
 
     Args:
         output_file: Path to the job output file
+        cycle_name: Cycle name if already known; derived from the
+            filename when omitted
 
     Returns:
         Tuple of (success, details)
     """
     try:
-        with open(output_file, 'r') as f:
-            content = f.read()
-
-        cycle_type, date, hour = extract_cycle_info(output_file)
-        cycle_name = f"{cycle_type}.{date}.{hour}"
+        if cycle_name is None:
+            cycle_type, date, hour = extract_cycle_info(output_file)
+            cycle_name = f"{cycle_type}.{date}.{hour}"
 
-        # Look for success pattern
         success_pattern = f"3DVAR completed successfully for {cycle_name}"
 
-        if success_pattern in content:
-            return True, f"Found success message: {success_pattern}"
-        else:
-            # Look for common error indicators
-            if "3DVAR failed for" in content:
-                return False, "Found failure message in output"
-            elif "Error:" in content:
-                return False, "Found error messages in output"
-            elif "SLURM: job" in content and "CANCELLED" in content:
-                return False, "Job was cancelled by SLURM"
-            else:
+        # Memory-map the file and scan it as bytes: the substring and
+        # regex searches then run over the page cache without decoding
+        # (or copying) the whole log into a Python string.
+        with open(output_file, 'rb') as f:
+            try:
+                content = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                content = f.read()  # empty files cannot be mapped
+
+            try:
+                # Look for success pattern (C-level substring search)
+                if content.find(success_pattern.encode()) != -1:
+                    return True, (
+                        f"Found success message: {success_pattern}"
+                    )
+
+                # Look for common error indicators in a single scan
+                match = _FAIL_RE.search(content)
+                if match:
+                    return False, _FAIL_DETAILS[match.lastindex]
                 return False, "Success message not found in output"
+            finally:
+                if isinstance(content, mmap.mmap):
+                    content.close()
 
     except FileNotFoundError:
         return False, f"Output file not found: {output_file}"
@@ -90,8 +156,32 @@ def check_job_success(output_file: str) -> Tuple[bool, str]:
         return False, f"Error reading file: {str(e)}"
 
 
+def check_output_file(output_file: str) -> Dict:
+    """
+    Build the status result dictionary for a single job output file.
+
+    Args:
+        output_file: Path to the job output file
+
+    Returns:
+        Dict with cycle name, output file, success flag and details
+    """
+    cycle_type, date, hour = extract_cycle_info(output_file)
+    cycle_name = f"{cycle_type}.{date}.{hour}"
+
+    success, details = check_job_success(output_file, cycle_name)
+
+    return {
+        'cycle': cycle_name,
+        'output_file': output_file,
+        'success': success,
+        'details': details
+    }
+
+
 def generate_markdown_report(
-    results: List[Dict],
+    successful: List[Dict],
+    failed: List[Dict],
     output_file: str,
     cycle_output_dir: str
 ) -> None:
@@ -99,36 +189,55 @@ def generate_markdown_report(
     Generate a markdown summary report of job completion status.
 
     Args:
-        results: List of job check results
+        successful: Job check results that succeeded
+        failed: Job check results that failed
         output_file: Path to write the markdown report
         cycle_output_dir: Directory that was scanned
     """
-    successful = [r for r in results if r['success']]
-    failed = [r for r in results if not r['success']]
+    total = len(successful) + len(failed)
+
+    # Accumulate the report in memory and emit it with a single write
+    parts = []
+    parts.append("# SLURM Job Completion Status Report\n\n")
+    parts.append(f"**Scan Directory:** `{cycle_output_dir}`\n\n")
+    parts.append(f"**Total Jobs Found:** {total}\n")
+    parts.append(f"**Successful:** {len(successful)}\n")
+    parts.append(f"**Failed:** {len(failed)}\n\n")
+
+    if successful:
+        parts.append("## ✅ Successful Jobs\n\n")
+        for result in sorted(successful, key=itemgetter('cycle')):
+            parts.append(f"- {result['cycle']}\n")
+
+    if failed:
+        parts.append("## ❌ Failed Jobs\n\n")
+        for result in sorted(failed, key=itemgetter('cycle')):
+            parts.append(f"- {result['cycle']}\n")
+
+    if not total:
+        parts.append("## No job output files found\n\n")
+        parts.append("Check that:\n")
+        parts.append("- The cycle output directory path is correct\n")
+        parts.append("- Jobs have completed and generated output files\n")
+        parts.append("- The file pattern matches your job output naming\n")
 
     with open(output_file, 'w') as f:
-        f.write("# SLURM Job Completion Status Report\n\n")
-        f.write(f"**Scan Directory:** `{cycle_output_dir}`\n\n")
-        f.write(f"**Total Jobs Found:** {len(results)}\n")
-        f.write(f"**Successful:** {len(successful)}\n")
-        f.write(f"**Failed:** {len(failed)}\n\n")
-
-        if successful:
-            f.write("## ✅ Successful Jobs\n\n")
-            for result in sorted(successful, key=lambda x: x['cycle']):
-                f.write(f"- {result['cycle']}\n")
-
-        if failed:
-            f.write("## ❌ Failed Jobs\n\n")
-            for result in sorted(failed, key=lambda x: x['cycle']):
-                f.write(f"- {result['cycle']}\n")
-
-        if not results:
-            f.write("## No job output files found\n\n")
-            f.write("Check that:\n")
-            f.write("- The cycle output directory path is correct\n")
-            f.write("- Jobs have completed and generated output files\n")
-            f.write("- The file pattern matches your job output naming\n")
+        f.write("".join(parts))
+
+
+def _split_results(results_iter, verbose: bool):
+    """Split streamed job results into successful and failed lists."""
+    successful: List[Dict] = []
+    failed: List[Dict] = []
+    for result in results_iter:
+        if result['success']:
+            successful.append(result)
+        else:
+            failed.append(result)
+        if verbose:
+            status = "SUCCESS" if result['success'] else "FAILED"
+            print(f"{result['cycle']}: {status} - {result['details']}")
+    return successful, failed
 
 
 def main():
@@ -165,6 +274,13 @@ def main():
         action="store_true",
         help="Enable verbose output"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker threads for checking output files "
+             "(default: 1)"
+    )
 
     args = parser.parse_args()
 
@@ -176,35 +292,31 @@ def main():
         for f in output_files:
             print(f"  {f}")
 
-    # Check each job's completion status
-    results = []
-    for output_file in output_files:
-        cycle_type, date, hour = extract_cycle_info(output_file)
-        cycle_name = f"{cycle_type}.{date}.{hour}"
-
-        success, details = check_job_success(output_file)
-
-        result = {
-            'cycle': cycle_name,
-            'output_file': output_file,
-            'success': success,
-            'details': details
-        }
-        results.append(result)
-
-        if args.verbose:
-            status = "SUCCESS" if success else "FAILED"
-            print(f"{cycle_name}: {status} - {details}")
+    # Check each job's completion status, streaming results directly
+    # into the success/failure split so no flat list of all jobs is
+    # held. Files are independent so the checks can run concurrently,
+    # with executor.map keeping the order.
+    if args.jobs > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=args.jobs
+        ) as executor:
+            results_iter = executor.map(check_output_file, output_files)
+            successful, failed = _split_results(results_iter, args.verbose)
+    else:
+        results_iter = map(check_output_file, output_files)
+        successful, failed = _split_results(results_iter, args.verbose)
 
     # Generate markdown report
-    generate_markdown_report(results, args.report_file, args.cycle_output_dir)
+    generate_markdown_report(
+        successful, failed, args.report_file, args.cycle_output_dir
+    )
 
     # Summary output
-    successful_count = len([r for r in results if r['success']])
-    failed_count = len([r for r in results if not r['success']])
+    successful_count = len(successful)
+    failed_count = len(failed)
 
     print("\nJob Status Summary:")
-    print(f"  Total jobs checked: {len(results)}")
+    print(f"  Total jobs checked: {successful_count + failed_count}")
     print(f"  Successful: {successful_count}")
     print(f"  Failed: {failed_count}")
     print(f"  Report written to: {args.report_file}")
@@ -25,9 +25,17 @@ obsforge_comroot/
 │           └── sst/
 """
 
+import concurrent.futures
 import sys
+from collections import Counter
 from pathlib import Path
 import yaml
+try:
+    # libyaml C bindings; an order of magnitude faster than the pure
+    # Python dumper for large summaries
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 import logging
 import argparse
 
@@ -36,6 +44,22 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.obsforge_cycle_processor import ObsForgeCycleProcessor  # noqa: E402
 
 
+def _process_one(init_kwargs, cycle, execution_mode, template_mode):
+    """
+    Process one cycle in a worker process.
+
+    The processor is rebuilt from its constructor arguments because
+    the logger and Jinja2 environment cannot be pickled.
+    """
+    processor = ObsForgeCycleProcessor(**init_kwargs)
+    cycle_type, date, hour = cycle
+    if execution_mode:
+        return processor.process_and_execute_cycle(
+            cycle_type, date, hour, execution_mode
+        )
+    return processor.process_cycle(cycle_type, date, hour, template_mode)
+
+
 def setup_logging(verbose: bool = False) -> logging.Logger:
     """Set up logging configuration."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -133,6 +157,15 @@ def main():
         action='store_true',
         help='Generate detailed status report organized per cycle'
     )
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=1,
+        help=(
+            'Number of worker processes for cycle processing '
+            '(default: 1, serial)'
+        )
+    )
 
     args = parser.parse_args()
 
@@ -178,39 +211,83 @@ def main():
             end_date=date_range[1] if date_range else None
         )
 
+        # When executing, drop cycles with no observation files before
+        # any template work; they could only ever be skipped
+        if args.execution_mode:
+            nonempty = processor.scanner.prefilter_nonempty(cycles)
+            if len(nonempty) < len(cycles):
+                logger.info(
+                    f"Skipping {len(cycles) - len(nonempty)} cycles "
+                    "with no observation files"
+                )
+            cycles = nonempty
+
         processed_cycles = []
         execution_results = []
 
         logger.info(f"Found {len(cycles)} cycles to process")
 
-        for cycle_type, date, hour in cycles:
-            try:
-                if args.execution_mode:
-                    # Process and execute
-                    result = processor.process_and_execute_cycle(
-                        cycle_type, date, hour, args.execution_mode
+        def record(cycle_type, date, hour, result):
+            processed_cycles.append(result)
+
+            if 'execution' in result:
+                execution_results.append(result['execution'])
+
+            msg = (
+                f"Successfully processed {cycle_type}.{date}.{hour}"
+            )
+            logger.info(msg)
+
+        if args.parallel > 1 and len(cycles) > 1:
+            # Cycles are independent (distinct inputs and per-cycle
+            # output directories), so fan them out across worker
+            # processes; results are collected in cycle order
+            init_kwargs = processor._init_kwargs()
+            max_workers = min(args.parallel, len(cycles))
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _process_one,
+                        init_kwargs,
+                        cycle,
+                        args.execution_mode,
+                        template_mode,
                     )
-                else:
-                    # Process only, but use correct template
-                    result = processor.process_cycle(
-                        cycle_type, date, hour, template_mode
+                    for cycle in cycles
+                ]
+                for (cycle_type, date, hour), future in zip(
+                    cycles, futures
+                ):
+                    try:
+                        record(cycle_type, date, hour, future.result())
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to process "
+                            f"{cycle_type}.{date}.{hour}: {e}"
+                        )
+        else:
+            for cycle_type, date, hour in cycles:
+                try:
+                    if args.execution_mode:
+                        # Process and execute
+                        result = processor.process_and_execute_cycle(
+                            cycle_type, date, hour, args.execution_mode
+                        )
+                    else:
+                        # Process only, but use correct template
+                        result = processor.process_cycle(
+                            cycle_type, date, hour, template_mode
+                        )
+
+                    record(cycle_type, date, hour, result)
+                except Exception as e:
+                    msg = (
+                        f"Failed to process {cycle_type}.{date}.{hour}: {e}"
                     )
-
-                processed_cycles.append(result)
-
-                if 'execution' in result:
-                    execution_results.append(result['execution'])
-
-                msg = (
-                    f"Successfully processed {cycle_type}.{date}.{hour}"
-                )
-                logger.info(msg)
-            except Exception as e:
-                msg = (
-                    f"Failed to process {cycle_type}.{date}.{hour}: {e}"
-                )
-                logger.error(msg)
-                continue
+                    logger.error(msg)
+                    continue
 
         summary = {
             'total_cycles': len(cycles),
@@ -220,12 +297,9 @@ def main():
             'execution_results': execution_results
         }
 
-        # Print summary
-        if args.status_report:
-            # Generate and display detailed status report
-            status_report = processor.generate_cycle_status_report(summary)
-            print(status_report)
-        else:
+        # Print summary; the detailed report is generated once below
+        # and covers the --status-report case as well
+        if not args.status_report:
             # Display basic summary
             print("\nProcessing Summary:")
             print(f"  Total cycles found: {summary['total_cycles']}")
@@ -233,56 +307,65 @@ def main():
             print(f"  Failed: {summary['failed_cycles']}")
 
             if args.execution_mode and 'execution_results' in summary:
-                execution_results = summary['execution_results']
-                submitted = len([
-                    r for r in execution_results
-                    if r.get('status') == 'submitted'
-                ])
-                completed = len([
-                    r for r in execution_results
-                    if r.get('status') == 'completed'
-                ])
-                failed_exec = len([
-                    r for r in execution_results
-                    if r.get('status') == 'failed'
-                ])
-
-            print("\nExecution Summary:")
-            print(f"  Jobs submitted to schedulers: {submitted}")
-            print(f"  Jobs completed directly: {completed}")
-            print(f"  Jobs failed to execute: {failed_exec}")
-
-            # Show job IDs for submitted jobs
-            job_ids = [
-                r.get('job_id') for r in execution_results
-                if r.get('job_id') is not None
-            ]
-            if job_ids:
-                job_id_str = ', '.join(map(str, job_ids))
-                print(f"  Scheduler Job IDs: {job_id_str}")
-
-        # Save summary to file
-        summary_path = Path(args.output_dir) / 'processing_summary.yaml'
-        with open(summary_path, 'w') as f:
-            yaml.dump(summary, f, default_flow_style=False)
-
-        logger.info(
-            f"Processing complete. Summary saved to {summary_path}"
-        )
+                # Tally statuses and collect job IDs in a single pass
+                status_counts = Counter()
+                job_ids = []
+                for r in summary['execution_results']:
+                    status_counts[r.get('status')] += 1
+                    job_id = r.get('job_id')
+                    if job_id is not None:
+                        job_ids.append(job_id)
+
+                print("\nExecution Summary:")
+                print("  Jobs submitted to schedulers: "
+                      f"{status_counts['submitted']}")
+                print("  Jobs completed directly: "
+                      f"{status_counts['completed']}")
+                print("  Jobs failed to execute: "
+                      f"{status_counts['failed']}")
+
+                # Show job IDs for submitted jobs
+                if job_ids:
+                    job_id_str = ', '.join(map(str, job_ids))
+                    print(f"  Scheduler Job IDs: {job_id_str}")
 
         # Generate and print detailed cycle status report
         detailed_report = processor.generate_cycle_status_report(summary)
         print(detailed_report)
 
-        # Generate and write separate markdown status reports
-        # for gfs and gdas cycles
-        processor.write_separated_status_reports(
-            summary, Path(args.output_dir)
-        )
+        summary_path = Path(args.output_dir) / 'processing_summary.yaml'
+
+        def write_summary():
+            with open(summary_path, 'w') as f:
+                yaml.dump(
+                    summary,
+                    f,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
-        # Write failed cycles summary markdown
-        processor.write_failed_cycles_summary(
-            summary, Path(args.output_dir)
+        # The summary YAML, the per-type status reports and the failed
+        # cycles summary all go to distinct files, so their writes can
+        # overlap instead of waiting on each other
+        output_dir = Path(args.output_dir)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+            writes = [
+                pool.submit(write_summary),
+                pool.submit(
+                    processor.write_separated_status_reports,
+                    summary, output_dir,
+                ),
+                pool.submit(
+                    processor.write_failed_cycles_summary,
+                    summary, output_dir,
+                ),
+            ]
+            for write in writes:
+                write.result()
+
+        logger.info(
+            f"Processing complete. Summary saved to {summary_path}"
         )
 
     except Exception as e:
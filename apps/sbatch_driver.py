@@ -7,17 +7,65 @@ This generates an sbatch script that runs the obsForge cycle processor over
  a date range.
 """
 
+import functools
 import os
+import re
+import sys
 import argparse
 from pathlib import Path
-from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader
+from typing import Dict, Any, TextIO
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+)
+
+
+# Compiled once; fullmatch plus the range checks below validate a
+# YYYYMMDD argument without building a datetime object
+_DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+
+
+def _valid_date(date: str) -> bool:
+    """Check that a date argument looks like YYYYMMDD."""
+    match = _DATE_RE.fullmatch(date)
+    return (
+        match is not None
+        and 1 <= int(match.group(2)) <= 12
+        and 1 <= int(match.group(3)) <= 31
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _jinja_env(template_dir: str) -> Environment:
+    """
+    One environment per template directory, shared within the process.
+
+    The bytecode cache persists compiled templates across runs so
+    repeat invocations skip the Jinja parse/compile step, and
+    auto_reload=False drops the per-render template mtime check.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+
 
+def render_sbatch_driver(
+    context: Dict[str, Any], template_dir: Path, out: TextIO
+) -> None:
+    """
+    Stream the rendered sbatch driver script into an open file.
 
-def render_sbatch_driver(context: Dict[str, Any], template_dir: Path) -> str:
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
+    Jinja emits the template in chunks, so the script never
+    materializes as one string and writing overlaps evaluation.
+    """
+    env = _jinja_env(str(template_dir))
     template = env.get_template("sbatch_driver.sh.j2")
-    return template.render(**context)
+    stream = template.stream(**context)
+    stream.enable_buffering(5)
+    stream.dump(out)
 
 
 def main() -> None:
@@ -107,6 +155,9 @@ def main() -> None:
     args = parser.parse_args()
 
     date_start, date_end = args.date_range
+    if not (_valid_date(date_start) and _valid_date(date_end)):
+        print("Error: Dates must be in YYYYMMDD format")
+        sys.exit(1)
     cycle_type = args.cycle_type
 
     # Determine repository root to pass as home_obsforge_validate
@@ -141,15 +192,17 @@ def main() -> None:
     if args.hpc_modules:
         context["hpc_modules"] = args.hpc_modules
 
-    # Render
+    # Render straight into the script file, executable from creation
+    # (one syscall fewer than open + chmod)
     template_dir = Path(args.templates).resolve()
-    rendered = render_sbatch_driver(context, template_dir)
-
-    # Write and chmod +x
     job_script_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(job_script_path, "w") as f:
-        f.write(rendered)
-    os.chmod(job_script_path, 0o755)
+    fd = os.open(
+        str(job_script_path),
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+        0o755,
+    )
+    with os.fdopen(fd, "w") as f:
+        render_sbatch_driver(context, template_dir, f)
 
     print(f"Wrote sbatch driver to: {job_script_path}")
 
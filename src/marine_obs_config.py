@@ -0,0 +1,574 @@
+"""
+Marine observation configuration generation from JCB-GDAS templates.
+
+This module resolves obsForge observation types against the marine
+observation templates shipped with the JCB-GDAS repository and
+assembles complete JEDI 3DVAR configurations from them.
+
+Two classes are provided:
+
+- JCBGDASTemplateManager: discovers the ``*.yaml.j2`` templates under
+  ``<jcb-gdas>/observations/marine`` and matches observation type
+  names to them.
+- MarineObsConfigGenerator: renders the matched templates and embeds
+  the resulting observer blocks into a full 3DVAR configuration.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import copy
+import functools
+import io
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import logging
+
+import yaml
+try:
+    # libyaml C bindings; several times faster than the pure Python
+    # loader/dumper on the rendered fragments and the final config
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+)
+
+logger = logging.getLogger(__name__)
+
+# Known aliases from generic obsForge observation types to their
+# JCB-GDAS template names; built once at import instead of per match
+_TYPE_MAPPING: Dict[str, str] = {
+    "sst": "sst_viirs_npp_l3u",
+    "sst_viirs": "sst_viirs_npp_l3u",
+    "sst_avhrr": "sst_avhrr_metop_a_l3u",
+    "sss": "sss_smap_l2",
+    "sss_smap": "sss_smap_l2",
+    "sss_smos": "sss_smos_l2",
+    "adt": "rads_adt_3a",
+    "rads": "rads_adt_3a",
+    "icec": "icec_amsr2_north",
+    "insitu": "insitu_temp_profile_argo",
+    "insitu_salt": "insitu_salt_profile_argo",
+}
+
+# Static shape of the 3DVAR configuration; _create_full_3dvar_config
+# deep-copies it and patches only the leaves that vary per call
+_3DVAR_SKELETON: Dict[str, Any] = {
+    "cost_function": {
+        "cost_type": "3D-Var",
+        "time_window": {
+            "begin": "2024-01-01T00:00:00Z",
+            "length": "PT6H",
+        },
+        "analysis_variables": [
+            "sea_water_temperature",
+            "sea_water_salinity",
+            "sea_surface_height_above_geoid",
+        ],
+        "geometry": {
+            "geom_grid_type": "latlon",
+            "mom6_input_nml": "mom_input.nml",
+        },
+        "background": {
+            "date": "2024-01-01T00:00:00Z",
+            "basename": "./INPUT/",
+            "state_variables": [
+                "tocn", "socn", "ssh", "hocn",
+            ],
+        },
+        "background_error": {
+            "covariance_model": "SABER",
+            "saber_central_block": {
+                "saber_block_name": "diffusion",
+            },
+        },
+        "observations": {
+            "observers": [],
+        },
+    },
+    "variational": {
+        "minimizer": {"algorithm": "RPCG"},
+        "iterations": [
+            {"ninner": 50, "gradient_norm_reduction": 1e-4},
+        ],
+    },
+    "final": {
+        "diagnostics": {"departures": "oman"},
+    },
+    "output": {
+        "filename": "3dvar_analysis.nc",
+    },
+}
+
+
+class _TeeWriter:
+    """Duplicate writes to two streams during a single YAML dump."""
+
+    def __init__(self, *streams: Any):
+        self._streams = streams
+
+    def write(self, data: str) -> None:
+        for stream in self._streams:
+            stream.write(data)
+
+
+class JCBGDASTemplateManager:
+    """Discover and match marine observation templates in JCB-GDAS."""
+
+    def __init__(self, jcb_gdas_path: Union[str, Path]):
+        """
+        Initialize the template manager.
+
+        Args:
+            jcb_gdas_path: Path to the JCB-GDAS repository root.
+
+        Raises:
+            FileNotFoundError: If the marine templates directory does
+                not exist under the given path.
+        """
+        self.jcb_gdas_path = Path(jcb_gdas_path)
+        self.marine_templates_path = (
+            self.jcb_gdas_path / "observations" / "marine"
+        )
+        if not self.marine_templates_path.exists():
+            raise FileNotFoundError(
+                f"Marine templates directory not found: "
+                f"{self.marine_templates_path}"
+            )
+        # Per-instance memoization: the same observation types recur
+        # across the obs_list, so repeated resolutions become a dict
+        # hit instead of re-walking the mapping and fallback logic.
+        self.match_observation_to_template = functools.lru_cache(
+            maxsize=256
+        )(self._match_observation_uncached)
+
+    @functools.cached_property
+    def available_templates(self) -> Tuple[str, ...]:
+        """
+        Template names available in the marine directory, sorted.
+
+        The directory is immutable for the lifetime of a run, so the
+        result is computed once and reused; call invalidate() if the
+        directory changes underneath a long-lived manager (tests).
+
+        os.scandir avoids the per-entry Path construction and stat
+        calls Path.glob performs; the known ".yaml.j2" suffix is
+        stripped with a single slice.
+        """
+        with os.scandir(self.marine_templates_path) as entries:
+            return tuple(sorted(
+                entry.name[:-8]
+                for entry in entries
+                if entry.name.endswith(".yaml.j2")
+                and entry.is_file(follow_symlinks=False)
+            ))
+
+    @functools.cached_property
+    def _available_set(self) -> frozenset:
+        """Set view of available_templates for O(1) membership."""
+        return frozenset(self.available_templates)
+
+    @functools.cached_property
+    def _token_index(self) -> Dict[str, str]:
+        """
+        Reverse index from name tokens to template names.
+
+        Each underscore-separated token of every template name maps
+        to the first (sorted) template containing it, so the partial
+        match in match_observation_to_template is a handful of dict
+        lookups instead of a scan over all templates per keyword.
+        """
+        index: Dict[str, str] = {}
+        for template in self.available_templates:
+            for token in template.lower().split("_"):
+                index.setdefault(token, template)
+        return index
+
+    def invalidate(self) -> None:
+        """Drop the cached template listing so it is rescanned."""
+        self.__dict__.pop("available_templates", None)
+        self.__dict__.pop("_available_set", None)
+        self.__dict__.pop("_token_index", None)
+        self.match_observation_to_template.cache_clear()
+
+    def list_available_templates(self) -> List[str]:
+        """List the available marine observation template names."""
+        return list(self.available_templates)
+
+    def get_cache_info(self) -> "functools._CacheInfo":
+        """Hit/miss statistics of the memoized template matcher."""
+        return self.match_observation_to_template.cache_info()
+
+    def _match_observation_uncached(
+        self, obs_type: str
+    ) -> Optional[str]:
+        """
+        Match an observation type name to a template name.
+
+        Tries, in order: an exact match, a match through the known
+        type aliases, and finally a partial keyword match against the
+        available template names.
+
+        Args:
+            obs_type: Observation type, e.g. "sst_viirs_npp_l3u".
+
+        Returns:
+            The matching template name, or None if nothing matches.
+        """
+        obs_type_lower = obs_type.lower()
+
+        # Exact match first
+        if obs_type_lower in self._available_set:
+            return obs_type_lower
+
+        # Known alias
+        mapped = _TYPE_MAPPING.get(obs_type_lower)
+        if mapped is not None and mapped in self._available_set:
+            return mapped
+
+        # Fall back to a partial keyword match via the reverse index
+        for keyword in obs_type_lower.split("_"):
+            template = self._token_index.get(keyword)
+            if template is not None:
+                return template
+
+        return None
+
+    def get_template_path(self, template_name: str) -> Path:
+        """
+        Return the path of a template file.
+
+        Raises:
+            FileNotFoundError: If the template does not exist.
+        """
+        # The cached listing already answers existence, so no stat
+        # syscall is spent here
+        if template_name not in self._available_set:
+            raise FileNotFoundError(
+                f"Template not found: "
+                f"{self.marine_templates_path}/{template_name}.yaml.j2"
+            )
+        return self.marine_templates_path / f"{template_name}.yaml.j2"
+
+
+class MarineObsConfigGenerator:
+    """Generate JEDI 3DVAR configurations from JCB-GDAS templates."""
+
+    def __init__(
+        self,
+        jcb_gdas_path: Union[str, Path],
+        template_dir: Union[str, Path],
+    ):
+        """
+        Initialize the configuration generator.
+
+        Args:
+            jcb_gdas_path: Path to the JCB-GDAS repository root.
+            template_dir: Path to the local templates directory
+                holding the 3DVAR skeleton template.
+        """
+        self.jcb_manager = JCBGDASTemplateManager(jcb_gdas_path)
+        self.template_dir = Path(template_dir)
+
+    @functools.cached_property
+    def env(self) -> Environment:
+        """
+        The Jinja environment, created on first render.
+
+        Deferred out of __init__ so constructing a generator for
+        validation or listing alone stays cheap.
+        """
+        # Compiled templates persist across processes so warm runs
+        # skip the Jinja lexer and parser entirely. No directory is
+        # passed: Jinja's default is a per-uid, mode-0700,
+        # ownership-checked cache dir, which a fixed shared path
+        # under /tmp would not be on multi-user hosts
+        return Environment(
+            loader=FileSystemLoader([
+                str(self.jcb_manager.marine_templates_path),
+                str(self.template_dir),
+            ]),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            # Templates do not change during a run: skip Jinja's
+            # per-lookup freshness stat and never evict compiled
+            # templates
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=FileSystemBytecodeCache(),
+        )
+
+    def validate_observations(
+        self, obs_list: List[Union[str, Dict[str, Any]]]
+    ) -> bool:
+        """
+        Validate that every observation entry is usable.
+
+        Entries may be plain type strings or dicts carrying a 'type'
+        key alongside optional input/output path settings.
+
+        Returns:
+            True if all entries are valid, False otherwise.
+        """
+        valid = True
+        for index, obs in enumerate(obs_list):
+            if isinstance(obs, str):
+                continue
+            if isinstance(obs, dict) and "type" in obs:
+                continue
+            logger.warning(
+                f"Invalid observation entry at index {index}: {obs!r}"
+            )
+            valid = False
+        return valid
+
+    def load_observations(
+        self, obs_list: List[Union[str, Dict[str, Any]]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Normalize observation entries to dict form.
+
+        String entries become ``{"type": <name>}``; dict entries pass
+        through unchanged.
+
+        Returns:
+            A tuple of (normalized entries, unique observation types
+            in first-seen order).
+        """
+        normalized: List[Dict[str, Any]] = []
+        obs_types: Dict[str, None] = {}
+        for obs in obs_list:
+            if isinstance(obs, str):
+                obs = {"type": obs}
+            normalized.append(obs)
+            obs_types[obs.get("type", "unknown")] = None
+        logger.debug(f"Loaded observation types: {list(obs_types)}")
+        return normalized, list(obs_types)
+
+    def generate_config_from_jcb(
+        self,
+        obs_list: List[Union[str, Dict[str, Any]]],
+        output_file: Optional[Union[str, Path]] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Generate a 3DVAR configuration from JCB templates.
+
+        Each observation is matched to its JCB-GDAS template, the
+        template is rendered and parsed, and the resulting observer
+        blocks are embedded in the full 3DVAR configuration.
+
+        Args:
+            obs_list: Observation type names or dict entries.
+            output_file: Optional path to also write the YAML to.
+            additional_context: Extra template context (e.g.
+                window_begin, output_filename).
+
+        Returns:
+            The rendered configuration as a YAML string.
+
+        Raises:
+            ValueError: On the first observation entry that is
+                neither a type string nor a dict with a 'type' key.
+        """
+        # Validate, normalize and resolve templates in one pass over
+        # the input (validate_observations stays available for
+        # callers that want a non-raising check), then load each
+        # unique template exactly once; the per-observation loop
+        # below works from the preloaded Template objects
+        resolved: List[Tuple[Dict[str, Any], str]] = []
+        for index, obs in enumerate(obs_list):
+            if isinstance(obs, str):
+                obs = {"type": obs}
+            elif not (isinstance(obs, dict) and "type" in obs):
+                raise ValueError(
+                    f"Invalid observation entry at index {index}: "
+                    f"{obs!r}"
+                )
+            obs_type = obs.get("type", "unknown")
+            template_name = (
+                self.jcb_manager.match_observation_to_template(obs_type)
+            )
+            if template_name is None:
+                logger.warning(
+                    f"No JCB template found for observation type: "
+                    f"{obs_type}"
+                )
+                continue
+            resolved.append((obs, template_name))
+
+        templates = {
+            name: self.env.get_template(f"{name}.yaml.j2")
+            for name in dict.fromkeys(
+                name for _, name in resolved
+            )
+        }
+
+        # The caller-supplied part of the template context is the
+        # same for every observation; merge it once up front
+        base_context = dict(additional_context or {})
+        base_context.setdefault("letkf_app", False)
+
+        def render_one(
+            pair: Tuple[Dict[str, Any], str]
+        ) -> Optional[Dict[str, Any]]:
+            obs, template_name = pair
+            context = self._prepare_jcb_context(obs, base_context)
+            rendered_obs = templates[template_name].render(**context)
+            try:
+                return yaml.load(rendered_obs, Loader=SafeLoader)
+            except yaml.YAMLError as e:
+                logger.warning(
+                    f"Failed to parse rendered template "
+                    f"{template_name}: {e}"
+                )
+                return None
+
+        # Observations with identical type and path settings render
+        # to identical fragments, so render once per distinct context
+        # key and replicate the parsed result
+        def context_key(
+            pair: Tuple[Dict[str, Any], str]
+        ) -> Tuple[Any, ...]:
+            obs, template_name = pair
+            return (
+                template_name,
+                obs.get("type"),
+                obs.get("input_path"),
+                obs.get("input_prefix"),
+                obs.get("input_suffix"),
+                obs.get("output_path"),
+                obs.get("output_prefix"),
+                obs.get("output_suffix"),
+            )
+
+        unique_pairs: Dict[Tuple[Any, ...], Tuple] = {}
+        for pair in resolved:
+            unique_pairs.setdefault(context_key(pair), pair)
+
+        # Render the distinct observer fragments concurrently; the C
+        # YAML loader releases the GIL, so parsing overlaps.
+        # executor.map preserves input order.
+        if len(unique_pairs) > 1:
+            workers = min(8, len(unique_pairs))
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers
+            ) as pool:
+                parsed_fragments = list(
+                    pool.map(render_one, unique_pairs.values())
+                )
+        else:
+            parsed_fragments = [
+                render_one(pair) for pair in unique_pairs.values()
+            ]
+        rendered_cache = dict(zip(unique_pairs, parsed_fragments))
+
+        obs_configs: List[Dict[str, Any]] = []
+        for pair in resolved:
+            parsed = rendered_cache[context_key(pair)]
+            if not parsed:
+                continue
+            observers = (
+                parsed.get("observations", {}).get("observers", [])
+            )
+            # Deep copy so downstream mutation of one replica cannot
+            # leak into the others
+            obs_configs.extend(copy.deepcopy(observers))
+
+        full_config = self._create_full_3dvar_config(
+            obs_configs, additional_context or {}
+        )
+        if output_file:
+            # Stream the dump straight into the file while teeing
+            # into an in-memory buffer for the return value: one
+            # serialization pass, no duplicated full-size string
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            buf = io.StringIO()
+            with open(output_path, "w", buffering=1 << 17) as f:
+                yaml.dump(
+                    full_config,
+                    _TeeWriter(f, buf),
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            logger.info(f"Configuration written to {output_path}")
+            return buf.getvalue()
+
+        return yaml.dump(
+            full_config,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
+    def _prepare_jcb_context(
+        self,
+        obs: Dict[str, Any],
+        base_context: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Build the template context for one observation entry.
+
+        base_context carries the caller-supplied settings, computed
+        once per generate_config_from_jcb call; it is overlaid last
+        so caller settings keep overriding the per-observation
+        defaults.
+        """
+        return {
+            "observation_from_jcb": obs.get("type", "unknown"),
+            "marine_obsdatain_path": obs.get("input_path", "./data"),
+            "marine_obsdatain_prefix": obs.get("input_prefix", ""),
+            "marine_obsdatain_suffix": obs.get(
+                "input_suffix", ".nc"
+            ),
+            "marine_obsdataout_path": obs.get(
+                "output_path", "./output"
+            ),
+            "marine_obsdataout_prefix": obs.get("output_prefix", ""),
+            "marine_obsdataout_suffix": obs.get(
+                "output_suffix", ".nc"
+            ),
+            **base_context,
+        }
+
+    def _create_full_3dvar_config(
+        self,
+        obs_configs: List[Dict[str, Any]],
+        context: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Assemble the full 3DVAR configuration dictionary.
+
+        Starts from a deep copy of the static module-level skeleton
+        and patches only the handful of leaves that vary with the
+        call context.
+        """
+        config = copy.deepcopy(_3DVAR_SKELETON)
+        cost_function = config["cost_function"]
+        window_begin = context.get(
+            "window_begin", "2024-01-01T00:00:00Z"
+        )
+        cost_function["time_window"]["begin"] = window_begin
+        cost_function["time_window"]["length"] = context.get(
+            "window_length", "PT6H"
+        )
+        cost_function["geometry"]["mom6_input_nml"] = context.get(
+            "mom6_input_nml", "mom_input.nml"
+        )
+        cost_function["background"]["date"] = window_begin
+        cost_function["background"]["basename"] = context.get(
+            "background_basename", "./INPUT/"
+        )
+        cost_function["observations"]["observers"] = obs_configs
+        config["output"]["filename"] = context.get(
+            "output_filename", "3dvar_analysis.nc"
+        )
+        return config
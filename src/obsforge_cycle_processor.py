@@ -1,16 +1,88 @@
 from __future__ import annotations
 
 import os
-import glob
+import concurrent.futures
+import io
+import re
 import subprocess
+import threading
+from collections import Counter
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TextIO, Tuple
 import logging
-from jinja2 import Environment, FileSystemLoader, ChoiceLoader
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+)
 
 from .obsforge_scanner import ObsForgeScanner
 
+# Compiled once at import; parses the job ID out of sbatch output
+_SBATCH_RE = re.compile(r"Submitted batch job (\d+)")
+
+# Extracts the JCB observation type out of an obsForge file name such
+# as "gdas.t06z.sst_viirs_npp.nc". Case folding lives in the compiled
+# pattern, so no per-file lower() allocation is needed.
+_OBS_FILE_RE = re.compile(r"\.t\d{2}z\.(?P<obs>[^.]+)\.nc$", re.IGNORECASE)
+
+# Cycle batches larger than this are dispatched to a process pool
+_PARALLEL_THRESHOLD = 4
+
+# Assimilation window length shared by every generated 3DVAR config
+_WINDOW_LENGTH = "PT6H"
+
+# Observation categories linked into every run directory, pre-sorted
+# for the job card template
+_OBS_CATEGORIES = ("adt", "icec", "insitu", "sss", "sst")
+
+# Status icons, built once instead of per reported cycle. The circled
+# and checked variants carry ANSI color codes (bright yellow/green).
+_ICON_FAILED = "❌"
+_ICON_COMPLETED = "✅"
+_ICON_SUBMITTED = "⏳"
+_ICON_NEUTRAL = "\033[93m○\033[0m"
+_ICON_GENERATED = "\033[92m✓\033[0m"
+_EXEC_ICONS = {
+    "completed": _ICON_COMPLETED,
+    "submitted": _ICON_SUBMITTED,
+    "failed": _ICON_FAILED,
+    "skipped": _ICON_NEUTRAL,
+}
+
+
+# One processor per worker process, built by the pool initializer so
+# the Jinja environments and scanner are constructed once per worker
+# rather than once per task
+_WORKER_PROCESSOR: Optional["ObsForgeCycleProcessor"] = None
+
+
+def _init_cycle_worker(init_kwargs: Dict[str, Any]) -> None:
+    """
+    Build the worker's processor when the pool starts.
+
+    The processor is rebuilt from its constructor arguments because
+    the logger and Jinja2 environment cannot be pickled across
+    processes.
+    """
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = ObsForgeCycleProcessor(**init_kwargs)
+
+
+def _process_cycle_worker(
+    cycle: Tuple[str, str, str],
+    execution_mode: str,
+    obs_files: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> Dict[str, Any]:
+    """Process a single cycle on the worker's shared processor."""
+    cycle_type, date, hour = cycle
+    return _WORKER_PROCESSOR.process_cycle(
+        cycle_type, date, hour, execution_mode, obs_files=obs_files
+    )
+
 
 class ObsForgeCycleProcessor:
     """Main processor for generating job cards and configs from cycles."""
@@ -42,14 +114,63 @@ class ObsForgeCycleProcessor:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set up Jinja2 environment for job card templates
+        # Set up Jinja2 environment for job card templates; the
+        # bytecode cache persists compiled templates across runs
         self.template_dir = Path(template_dir)
         self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.template_dir))
+            loader=FileSystemLoader(str(self.template_dir)),
+            bytecode_cache=FileSystemBytecodeCache(),
         )
 
-        # Store JCB-GDAS path for 3DVAR rendering includes
+        # Compiled job card templates, fetched once per execution mode
+        self._job_card_templates: Dict[str, Any] = {}
+
+        # Rendered observer blocks, keyed by everything their render
+        # context depends on; cycles sharing a key reuse the block
+        # instead of re-rendering. Guarded by a lock so concurrent
+        # renders stay safe.
+        self._observer_render_cache: Dict[Tuple[str, ...], str] = {}
+        self._render_cache_lock = threading.Lock()
+
+        # Observation file listings per cycle; process_cycle and
+        # _generate_3dvar_config both need the same listing, so the
+        # second lookup is served from here instead of a re-scan
+        self._obs_files_cache: Dict[
+            Tuple[str, str, str], List[str]
+        ] = {}
+
+        # Store JCB-GDAS path for 3DVAR rendering includes; the
+        # marine templates subdirectory is derived once instead of
+        # re-joining the path per cycle
         self.jcb_gdas_path = Path(jcb_gdas_path)
+        self._jcb_marine_dir = (
+            self.jcb_gdas_path / "observations" / "marine"
+        )
+
+        # Shared environment for 3DVAR config rendering, built once
+        # and reused across cycles so every observer template and the
+        # main 3DVAR template compile a single time. Templates do not
+        # change during a run, so freshness checks are skipped and
+        # compiled templates are never evicted. Compiled bytecode is
+        # persisted under the output directory so later invocations
+        # skip the Jinja parse/compile step entirely.
+        jinja_cache_dir = self.output_dir / ".jinja_cache"
+        jinja_cache_dir.mkdir(exist_ok=True)
+        self._config_env = Environment(
+            loader=ChoiceLoader(
+                [
+                    FileSystemLoader(str(self.template_dir)),
+                    FileSystemLoader(str(self._jcb_marine_dir)),
+                ]
+            ),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=FileSystemBytecodeCache(
+                str(jinja_cache_dir), "%s.cache"
+            ),
+        )
 
         # Optional JEDI root and SOCA scratch path
         self.jedi_root = jedi_root
@@ -68,34 +189,82 @@ class ObsForgeCycleProcessor:
         Returns:
             Summary dictionary of processed cycles
         """
-        cycles = self.scanner.find_cycles(
+        # One pruned walk yields both the cycle list and each cycle's
+        # observations, instead of re-scanning the tree per cycle
+        all_observations = self.scanner.scan_all(
             cycle_types=["gfs"]
         )  # keep same behavior
+        cycles = sorted(all_observations)
         processed_cycles: List[Dict[str, Any]] = []
 
         self.logger.info(f"Found {len(cycles)} cycles to process")
 
-        for cycle_type, date, hour in cycles:
-            try:
-                result = self.process_cycle(
-                    cycle_type, date, hour, execution_mode
-                )
-                processed_cycles.append(result)
-                self.logger.info(
-                    "Successfully processed %s.%s.%s",
-                    cycle_type,
-                    date,
-                    hour,
-                )
-            except Exception as e:
-                self.logger.error(
-                    "Failed to process %s.%s.%s: %s",
-                    cycle_type,
-                    date,
-                    hour,
-                    e,
-                )
-                continue
+        if len(cycles) > _PARALLEL_THRESHOLD:
+            # Cycles are independent (separate scans, renders and
+            # output files), so large batches fan out across processes
+            init_kwargs = self._init_kwargs()
+            max_workers = min(os.cpu_count() or 1, len(cycles))
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_cycle_worker,
+                initargs=(init_kwargs,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _process_cycle_worker,
+                        cycle,
+                        execution_mode,
+                        all_observations[cycle],
+                    )
+                    for cycle in cycles
+                ]
+                for (cycle_type, date, hour), future in zip(
+                    cycles, futures
+                ):
+                    try:
+                        processed_cycles.append(future.result())
+                        self.logger.info(
+                            "Successfully processed %s.%s.%s",
+                            cycle_type,
+                            date,
+                            hour,
+                        )
+                    except Exception as e:
+                        self.logger.error(
+                            "Failed to process %s.%s.%s: %s",
+                            cycle_type,
+                            date,
+                            hour,
+                            e,
+                        )
+        else:
+            for cycle_type, date, hour in cycles:
+                try:
+                    result = self.process_cycle(
+                        cycle_type,
+                        date,
+                        hour,
+                        execution_mode,
+                        obs_files=all_observations[
+                            (cycle_type, date, hour)
+                        ],
+                    )
+                    processed_cycles.append(result)
+                    self.logger.info(
+                        "Successfully processed %s.%s.%s",
+                        cycle_type,
+                        date,
+                        hour,
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        "Failed to process %s.%s.%s: %s",
+                        cycle_type,
+                        date,
+                        hour,
+                        e,
+                    )
+                    continue
 
         # Consider cycles with no observations and/or missing status log
         # as failures
@@ -125,15 +294,84 @@ class ObsForgeCycleProcessor:
 
         return summary
 
+    def _init_kwargs(self) -> Dict[str, Any]:
+        """Constructor arguments for rebuilding this processor in a
+        worker process."""
+        return {
+            "obsforge_comroot": self.obsforge_comroot,
+            "output_dir": str(self.output_dir),
+            "jcb_gdas_path": str(self.jcb_gdas_path),
+            "template_dir": str(self.template_dir),
+            "jedi_root": self.jedi_root,
+            "socascratch": self.socascratch,
+            "hpc_modules": self.hpc_modules,
+        }
+
+    def _scan_obs_files(
+        self, cycle_type: str, date: str, hour: str
+    ) -> List[str]:
+        """
+        Enumerate a cycle's observation files in one scandir pass.
+
+        Replaces the glob pattern "<obs_dir>/*/<cycle>.t<hour>z.*.nc"
+        with literal prefix/suffix checks on directory entries: one
+        scandir of the ocean directory for the obs-type
+        subdirectories, one scandir per subdirectory, no fnmatch and
+        no per-entry stat.
+
+        Returns:
+            Matching observation file basenames.
+        """
+        cache_key = (cycle_type, date, hour)
+        cached = self._obs_files_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        obs_dir = os.path.join(
+            self.obsforge_comroot,
+            f"{cycle_type}.{date}",
+            hour,
+            "ocean",
+        )
+        prefix = f"{cycle_type}.t{hour}z."
+        names: List[str] = []
+        try:
+            subdirs = [
+                entry.path
+                for entry in os.scandir(obs_dir)
+                if entry.is_dir()
+            ]
+        except OSError:
+            self._obs_files_cache[cache_key] = names
+            return names
+        for subdir in subdirs:
+            try:
+                with os.scandir(subdir) as entries:
+                    names.extend(
+                        entry.name
+                        for entry in entries
+                        if entry.name.startswith(prefix)
+                        and entry.name.endswith(".nc")
+                    )
+            except OSError:
+                continue
+        self._obs_files_cache[cache_key] = names
+        return names
+
     def process_cycle(
         self,
         cycle_type: str,
         date: str,
         hour: str,
-        execution_mode: str = "sbatch"
+        execution_mode: str = "sbatch",
+        obs_files: Optional[Dict[str, Tuple[str, ...]]] = None,
     ) -> Dict[str, Any]:
         """
         Process a single cycle and generate job card and config.
+
+        Args:
+            obs_files: Observations for this cycle if already scanned
+                (e.g. by ObsForgeScanner.scan_all); scanned here when
+                omitted
         """
         cycle_name = f"{cycle_type}.{date}.{hour}"
         self.logger.info(f"Processing cycle: {cycle_name}")
@@ -152,10 +390,11 @@ class ObsForgeCycleProcessor:
                 "Status log missing for %s: %s", cycle_name, status_log_path
             )
 
-        # Scan for available observations
-        obs_files = self.scanner.scan_cycle_observations(
-            cycle_type, date, hour
-        )
+        # Scan for available observations unless already provided
+        if obs_files is None:
+            obs_files = self.scanner.scan_cycle_observations(
+                cycle_type, date, hour
+            )
 
         if not obs_files:
             self.logger.warning(f"No observations found for {cycle_name}")
@@ -170,29 +409,34 @@ class ObsForgeCycleProcessor:
             }
 
         # Map to JCB observation types
-        obs_dir = os.path.join(
-            self.obsforge_comroot,
-            f"{cycle_type}.{date}",
-            f"{hour}",
-            "ocean",
-        )
-        obs_file_list = glob.glob(
-            os.path.join(obs_dir, "*", f"{cycle_type}.t{hour}z.*.nc")
-        )
-
-        jcb_obs_types: List[str] = []
-        for obs_file in obs_file_list:
-            mapped_type = f"{obs_file.split('.')[3]}"
-            jcb_obs_types.append(mapped_type)
+        obs_file_names = self._scan_obs_files(cycle_type, date, hour)
+
+        # Dict accumulator dedups in O(1) while preserving file order
+        jcb_types_acc: Dict[str, None] = {}
+        for obs_file in obs_file_names:
+            match = _OBS_FILE_RE.search(obs_file)
+            if match:
+                jcb_types_acc[match.group("obs").lower()] = None
+        jcb_obs_types = list(jcb_types_acc)
+
+        # Create the cycle-specific output directory once for both
+        # generated files
+        cycle_output_dir = self.output_dir / f"{cycle_type}.{date}" / hour
+        cycle_output_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate job card
         job_card_path = self._generate_job_card(
-            cycle_type, date, hour, jcb_obs_types, execution_mode
+            cycle_type,
+            date,
+            hour,
+            jcb_obs_types,
+            cycle_output_dir,
+            execution_mode,
         )
 
         # Generate 3DVAR configuration
         config_path = self._generate_3dvar_config(
-            cycle_type, date, hour, jcb_obs_types
+            cycle_type, date, hour, jcb_obs_types, cycle_output_dir
         )
 
         return {
@@ -211,20 +455,17 @@ class ObsForgeCycleProcessor:
         date: str,
         hour: str,
         jcb_obs_types: List[str],
+        cycle_output_dir: Path,
         execution_mode: str = "sbatch",
     ) -> Path:
-        """Generate a job card script for the cycle."""
-        cycle_name = f"{cycle_type}.{date}.{hour}"
-
-        # Create cycle-specific output directory
-        cycle_output_dir = self.output_dir / f"{cycle_type}.{date}" / hour
-        cycle_output_dir.mkdir(parents=True, exist_ok=True)
+        """Generate a job card script for the cycle.
 
+        cycle_output_dir is created by process_cycle before either
+        generator runs.
+        """
+        cycle_name = f"{cycle_type}.{date}.{hour}"
         job_card_path = cycle_output_dir / f"job_{cycle_name}.sh"
 
-        # Determine observation categories for data linking
-        obs_categories = {"adt", "sst", "sss", "icec", "insitu"}
-
         # Template context
         template_context = {
             "cycle_name": cycle_name,
@@ -233,7 +474,7 @@ class ObsForgeCycleProcessor:
             "cycle_hour": hour,
             "jcb_obs_types": jcb_obs_types,
             "obsforge_root": self.obsforge_comroot,
-            "obs_categories": sorted(obs_categories),
+            "obs_categories": list(_OBS_CATEGORIES),
             # templated options
             "jedi_root": self.jedi_root,
             "socascratch": self.socascratch,
@@ -246,16 +487,25 @@ class ObsForgeCycleProcessor:
         else:
             template_name = "job_card.sh.j2"  # Default to SLURM template
 
-        # Load and render template
-        template = self.jinja_env.get_template(template_name)
+        # Load and render template (compiled once, reused per cycle)
+        template = self._job_card_templates.get(template_name)
+        if template is None:
+            template = self.jinja_env.get_template(template_name)
+            self._job_card_templates[template_name] = template
         job_card_content = template.render(**template_context)
 
-        # Write job card
-        with open(job_card_path, "w") as f:
-            f.write(job_card_content)
-
-        # Make executable
-        os.chmod(job_card_path, 0o755)
+        # Write job card, executable from creation (one syscall fewer
+        # than open + chmod per cycle). The rendered script is small,
+        # so encode once and emit it with a single unbuffered write.
+        fd = os.open(
+            str(job_card_path),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o755,
+        )
+        try:
+            os.write(fd, job_card_content.encode("utf-8"))
+        finally:
+            os.close(fd)
 
         return job_card_path
 
@@ -265,29 +515,33 @@ class ObsForgeCycleProcessor:
         date: str,
         hour: str,
         jcb_obs_types: List[str],
+        cycle_output_dir: Path,
     ) -> Path:
-        """Generate 3DVAR YAML configuration for the cycle."""
-        cycle_name = f"{cycle_type}.{date}.{hour}"
-
-        # Create cycle-specific output directory
-        # (should already exist from job card)
-        cycle_output_dir = self.output_dir / f"{cycle_type}.{date}" / hour
-        cycle_output_dir.mkdir(parents=True, exist_ok=True)
+        """Generate 3DVAR YAML configuration for the cycle.
 
+        cycle_output_dir is created by process_cycle before either
+        generator runs.
+        """
+        cycle_name = f"{cycle_type}.{date}.{hour}"
         config_path = cycle_output_dir / f"config_{cycle_name}.yaml"
 
-        # Prepare datetime objects for configuration
-        cycle_datetime = datetime.strptime(f"{date}{hour}", "%Y%m%d%H")
+        # Prepare datetime objects for configuration; the fields are
+        # fixed-width, so direct slicing skips strptime's format
+        # parsing
+        cycle_datetime = datetime(
+            int(date[0:4]), int(date[4:6]), int(date[6:8]), int(hour)
+        )
         window_begin = cycle_datetime - timedelta(hours=3)
         window_middle = cycle_datetime
         window_end = cycle_datetime + timedelta(hours=3)
 
-        # Additional context for template rendering
+        # Additional context for template rendering; formatting via
+        # f-strings skips the strftime attribute lookup per timestamp
         additional_context = {
-            "window_begin": window_begin.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "window_middle": window_middle.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "window_end": window_end.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "window_length": "PT6H",
+            "window_begin": f"{window_begin:%Y-%m-%dT%H:%M:%SZ}",
+            "window_middle": f"{window_middle:%Y-%m-%dT%H:%M:%SZ}",
+            "window_end": f"{window_end:%Y-%m-%dT%H:%M:%SZ}",
+            "window_length": _WINDOW_LENGTH,
             "cycle_type": cycle_type,
             "cycle_date": date,
             "cycle_hour": hour,
@@ -295,44 +549,32 @@ class ObsForgeCycleProcessor:
             "output_dir": f"./output_{cycle_name}",
         }
 
-        # Build list of templates from available observation files
-        obs_dir = os.path.join(
-            self.obsforge_comroot,
-            f"{cycle_type}.{window_middle.strftime('%Y%m%d')}",
-            f"{hour}",
-            "ocean",
-        )
-        obs_file_list = glob.glob(
-            os.path.join(obs_dir, "*", f"{cycle_type}.t{hour}z.*.nc")
-        )
-
-        available_templates: List[str] = []
-        for obs_file in obs_file_list:
-            available_templates.append(
-                os.path.basename(obs_file).split('.')[2] + ".yaml.j2"
-            )
-        jcb_templates_dir = (
-            Path(self.jcb_gdas_path) / "observations" / "marine"
-        )
-
-        env = Environment(
-            loader=ChoiceLoader(
-                [
-                    FileSystemLoader(str(self.template_dir)),
-                    FileSystemLoader(str(jcb_templates_dir)),
-                ]
-            ),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        # The observation types were already extracted from the file
+        # listing by process_cycle; derive the template names from
+        # them instead of re-enumerating the directory
+        available_templates = [
+            f"{obs_type}.yaml.j2" for obs_type in jcb_obs_types
+        ]
+        jcb_templates_dir = self._jcb_marine_dir
+
+        # Shared, pre-configured environment; observer templates were
+        # compiled at most once for the whole run
+        env = self._config_env
+
+        # Per-observer render settings shared by every template of
+        # this cycle
+        marine_context = {
+            "marine_obsdatain_prefix": f"{cycle_type}.t{hour}z.",
+            "marine_obsdatain_path": ".",
+            "marine_obsdatain_suffix": ".nc",
+            "marine_obsdataout_path": ".",
+            "marine_obsdataout_suffix": ".out.nc",
+        }
 
-        # Pre-render each observer template to a YAML block string
-        rendered_observer_blocks: List[str] = []
-        print('############# available_templates:')
-        print(available_templates)
-        for name in available_templates:
+        def render_observer(name: str) -> Optional[str]:
+            """Render one observer block, or None when skipped."""
             # Explicitly check presence in JCB-GDAS templates dir
-            jcb_template_path = Path(jcb_templates_dir) / name
+            jcb_template_path = jcb_templates_dir / name
             if not jcb_template_path.exists():
                 self.logger.warning(
                     f"-- {name} template is missing JCB-GDAS template in "
@@ -340,42 +582,76 @@ class ObsForgeCycleProcessor:
                     str(jcb_templates_dir),
                     name,
                 )
-                continue
+                return None
 
             observer_name = name.replace(".yaml.j2", "")
-            marine_obsdatain_path = "."
-            marine_obsdatain_prefix = f"{cycle_type}.t{hour}z."
+
+            # The render context is fully determined by the observer
+            # name, cycle type, hour and window bounds; reuse the
+            # block when an identical one was already rendered
+            cache_key = (
+                observer_name,
+                cycle_type,
+                hour,
+                additional_context["window_begin"],
+                additional_context["window_end"],
+            )
+            with self._render_cache_lock:
+                cached_block = self._observer_render_cache.get(
+                    cache_key
+                )
+            if cached_block is not None:
+                return cached_block
+
             render_context = {
                 **additional_context,
+                **marine_context,
                 "observation_from_jcb": observer_name,
-                "marine_obsdatain_prefix": marine_obsdatain_prefix,
-                "marine_obsdatain_path": marine_obsdatain_path,
-                "marine_obsdatain_suffix": ".nc",
-                "marine_obsdataout_path": ".",
-                "marine_obsdataout_suffix": ".out.nc",
             }
-
             try:
                 obs_tmpl = env.get_template(name)
                 block = obs_tmpl.render(**render_context)
-                if block and block.strip():
-                    rendered_observer_blocks.append(block)
-                else:
-                    self.logger.warning(
-                        "Rendered observer template is empty, skipping: %s",
-                        name,
-                    )
             except Exception as e:
                 self.logger.error(
                     "Failed to render observer template %s: %s",
                     name,
                     e,
                 )
+                return None
+            if not (block and block.strip()):
+                self.logger.warning(
+                    "Rendered observer template is empty, skipping: %s",
+                    name,
+                )
+                return None
+            with self._render_cache_lock:
+                self._observer_render_cache[cache_key] = block
+            return block
+
+        # Observer renders are independent of each other; overlap
+        # them for cycles carrying several observation types.
+        # executor.map preserves input order.
+        if len(available_templates) > 1:
+            workers = min(8, len(available_templates))
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers
+            ) as pool:
+                blocks = list(
+                    pool.map(render_observer, available_templates)
+                )
+        else:
+            blocks = [
+                render_observer(name) for name in available_templates
+            ]
+        rendered_observer_blocks = [
+            block for block in blocks if block is not None
+        ]
 
         # Render main 3DVAR template with the list of pre-rendered blocks
         template = env.get_template("jedi_3dvar_template.yaml.j2")
         rendered = template.render(
-            **render_context,
+            **additional_context,
+            **marine_context,
             rendered_observer_blocks=rendered_observer_blocks,
         )
 
@@ -410,19 +686,53 @@ class ObsForgeCycleProcessor:
                 )
             )
 
+    def submit_all(
+        self, job_card_paths: List[Path], max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit a batch of job cards to SLURM concurrently.
+
+        Each sbatch call is an RPC to the SLURM controller, so serial
+        submission of many cycles is latency-bound; the GIL is released
+        while each child process runs, letting threads overlap the
+        round trips. Results are returned in job-card order.
+
+        Args:
+            job_card_paths: Job card paths to submit
+            max_workers: Upper bound on concurrent sbatch calls
+
+        Returns:
+            List of submission result dictionaries
+        """
+        cycle_names = [
+            path.stem.replace("job_", "") for path in job_card_paths
+        ]
+        if len(job_card_paths) <= 1:
+            return [
+                self._submit_to_slurm(path, name)
+                for path, name in zip(job_card_paths, cycle_names)
+            ]
+
+        workers = min(max_workers, len(job_card_paths))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            return list(
+                executor.map(
+                    self._submit_to_slurm, job_card_paths, cycle_names
+                )
+            )
+
     def _submit_to_slurm(
         self, job_card_path: Path, cycle_name: str
     ) -> Dict[str, Any]:
         """Submit job card to SLURM scheduler."""
         try:
-            # Change to the job card directory for execution
-            original_cwd = Path.cwd()
-            job_dir = job_card_path.parent
-            os.chdir(job_dir)
-
-            # Submit job
+            # Run from the job card directory via cwd=; no process-wide
+            # chdir, so submissions are safe to run concurrently
             result = subprocess.run(
                 ["sbatch", str(job_card_path.name)],
+                cwd=str(job_card_path.parent),
                 capture_output=True,
                 text=True,
                 check=True,
@@ -431,12 +741,7 @@ class ObsForgeCycleProcessor:
             # Parse job ID from sbatch output
             job_id: Optional[int] = None
             if result.stdout:
-                import re
-
-                match = re.search(
-                    r"Submitted batch job (\d+)",
-                    result.stdout,
-                )
+                match = _SBATCH_RE.search(result.stdout)
                 if match:
                     job_id = int(match.group(1))
 
@@ -480,22 +785,17 @@ class ObsForgeCycleProcessor:
                 "job_id": None,
                 "error": error_msg,
             }
-        finally:
-            os.chdir(original_cwd)
 
     def _submit_to_pbs(
         self, job_card_path: Path, cycle_name: str
     ) -> Dict[str, Any]:
         """Submit job card to PBS scheduler."""
         try:
-            # Change to the job card directory for execution
-            original_cwd = Path.cwd()
-            job_dir = job_card_path.parent
-            os.chdir(job_dir)
-
-            # Submit job
+            # Run from the job card directory via cwd=; no process-wide
+            # chdir, so submissions are safe to run concurrently
             result = subprocess.run(
                 ["qsub", str(job_card_path.name)],
+                cwd=str(job_card_path.parent),
                 capture_output=True,
                 text=True,
                 check=True,
@@ -546,49 +846,53 @@ class ObsForgeCycleProcessor:
                 "job_id": None,
                 "error": error_msg,
             }
-        finally:
-            os.chdir(original_cwd)
 
     def _run_directly(
         self, job_card_path: Path, cycle_name: str
     ) -> Dict[str, Any]:
         """Run job card directly in bash."""
+        log_path = job_card_path.parent / f"{cycle_name}.log"
         try:
-            # Change to the job card directory for execution
-            original_cwd = Path.cwd()
-            job_dir = job_card_path.parent
-            os.chdir(job_dir)
-
-            # Run job directly
-            result = subprocess.run(
-                ["bash", str(job_card_path.name)],
-                capture_output=True,
-                text=True,
-            )
+            # Run from the job card directory via cwd=; no process-wide
+            # chdir, so executions are safe to run concurrently. The
+            # job's output streams straight into a log file instead of
+            # being buffered whole in memory.
+            with open(log_path, "w") as log_file:
+                process = subprocess.Popen(
+                    ["bash", str(job_card_path.name)],
+                    cwd=str(job_card_path.parent),
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                )
+                return_code = process.wait()
 
             status = (
-                "completed" if result.returncode == 0 else "failed"
+                "completed" if return_code == 0 else "failed"
             )
             log_level = (
-                logging.INFO if result.returncode == 0 else logging.ERROR
+                logging.INFO if return_code == 0 else logging.ERROR
             )
 
             self.logger.log(
                 log_level,
                 (
                     f"Direct execution of {cycle_name} {status} with "
-                    f"return code {result.returncode}"
+                    f"return code {return_code}"
                 ),
             )
 
-            return {
+            result = {
                 "cycle": cycle_name,
                 "execution_mode": "bash",
                 "status": status,
-                "return_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "return_code": return_code,
+                "log_file": str(log_path),
             }
+            if return_code != 0:
+                result["error"] = (
+                    f"Return code {return_code}; see {log_path}"
+                )
+            return result
 
         except Exception as e:
             self.logger.error(
@@ -601,8 +905,6 @@ class ObsForgeCycleProcessor:
                 "return_code": -1,
                 "error": str(e),
             }
-        finally:
-            os.chdir(original_cwd)
 
     def process_and_execute_cycle(
         self,
@@ -642,69 +944,64 @@ class ObsForgeCycleProcessor:
         """
         Generate a detailed status report organized per cycle.
         """
-        report_lines: List[str] = []
-        report_lines.append("=" * 80)
-        report_lines.append("OBSFORGE CYCLE STATUS REPORT")
-        report_lines.append("=" * 80)
+        # Lines stream into one growing buffer instead of a list that
+        # is joined afterwards; large runs list every file per cycle
+        buf = io.StringIO()
+
+        def line(text: str = "") -> None:
+            if buf.tell():
+                buf.write("\n")
+            buf.write(text)
+
+        line("=" * 80)
+        line("OBSFORGE CYCLE STATUS REPORT")
+        line("=" * 80)
 
         # Overall summary
-        report_lines.append("\nOVERALL SUMMARY:")
+        line("\nOVERALL SUMMARY:")
         total_cycles = summary.get("total_cycles", 0)
         processed_cycles = summary.get("processed_cycles", 0)
         failed_cycles = summary.get("failed_cycles", 0)
 
-        report_lines.append(f"  Total cycles found: {total_cycles}")
-        report_lines.append(
+        line(f"  Total cycles found: {total_cycles}")
+        line(
             f"  Successfully processed: {processed_cycles}"
         )
-        report_lines.append(f"  Failed to process: {failed_cycles}")
+        line(f"  Failed to process: {failed_cycles}")
 
         # Execution summary if available
         if "execution_results" in summary:
-            execution_results = summary["execution_results"]
-            submitted = len(
-                [
-                    r
-                    for r in execution_results
-                    if r.get("status") == "submitted"
-                ]
+            # One pass tallies every status at once
+            status_counts = Counter(
+                r.get("status") for r in summary["execution_results"]
             )
-            completed = len(
-                [
-                    r
-                    for r in execution_results
-                    if r.get("status") == "completed"
-                ]
+
+            line("\nEXECUTION SUMMARY:")
+            line(
+                "  Jobs submitted to schedulers: "
+                f"{status_counts['submitted']}"
             )
-            failed_exec = len(
-                [
-                    r
-                    for r in execution_results
-                    if r.get("status") == "failed"
-                ]
+            line(
+                "  Jobs completed directly: "
+                f"{status_counts['completed']}"
             )
-            skipped = len(
-                [
-                    r
-                    for r in execution_results
-                    if r.get("status") == "skipped"
-                ]
+            line(
+                "  Jobs failed to execute: "
+                f"{status_counts['failed']}"
+            )
+            line(
+                "  Jobs skipped (no observations): "
+                f"{status_counts['skipped']}"
             )
-
-            report_lines.append("\nEXECUTION SUMMARY:")
-            report_lines.append(f"  Jobs submitted to schedulers: {submitted}")
-            report_lines.append(f"  Jobs completed directly: {completed}")
-            report_lines.append(f"  Jobs failed to execute: {failed_exec}")
-            report_lines.append(f"  Jobs skipped (no observations): {skipped}")
 
         # Detailed cycle information
-        report_lines.append("\nDETAILED CYCLE STATUS:")
-        report_lines.append("-" * 80)
+        line("\nDETAILED CYCLE STATUS:")
+        line("-" * 80)
 
         cycles = summary.get("cycles", [])
         if not cycles:
-            report_lines.append("No cycles processed.")
-            return "\n".join(report_lines)
+            line("No cycles processed.")
+            return buf.getvalue()
 
         # Sort cycles by cycle name for consistent output
         sorted_cycles = sorted(cycles, key=lambda x: x.get("cycle", ""))
@@ -721,48 +1018,48 @@ class ObsForgeCycleProcessor:
                 cycle_data, execution
             )
 
-            report_lines.append(f"\n{cycle_status_icon} Cycle: {cycle_name}")
+            line(f"\n{cycle_status_icon} Cycle: {cycle_name}")
 
             # Observation files found
             if observations:
-                report_lines.append("  Observations Found:")
+                line("  Observations Found:")
                 for obs_type, files in observations.items():
                     obs_line = (
                         f"    {obs_type.upper()}: {len(files)} files"
                     )
-                    report_lines.append(obs_line)
+                    line(obs_line)
                     # Show ALL files, not just first 3
                     for file in files:
-                        report_lines.append(f"      - {file}")
+                        line(f"      - {file}")
             else:
-                report_lines.append("  Observations Found: None")
+                line("  Observations Found: None")
 
             # JCB observation types mapped
             if jcb_types:
-                report_lines.append("  JCB Types for Assimilation:")
+                line("  JCB Types for Assimilation:")
                 for jcb_type in jcb_types:
-                    report_lines.append(f"    - {jcb_type}")
+                    line(f"    - {jcb_type}")
             else:
-                report_lines.append(
+                line(
                     "  JCB Types for Assimilation: None"
                 )
 
             # Job card status
             if job_card:
-                job_name = Path(job_card).name
-                report_lines.append(
+                job_name = os.path.basename(job_card)
+                line(
                     f"  Job Card: Generated ({job_name})"
                 )
             else:
-                report_lines.append(
+                line(
                     "  Job Card: Not generated (no observations)"
                 )
 
             # Status log presence
             if cycle_data.get("status_log_missing"):
-                report_lines.append("  Status log: Missing")
+                line("  Status log: Missing")
             else:
-                report_lines.append("  Status log: Present")
+                line("  Status log: Present")
 
             # Execution status
             if execution:
@@ -785,7 +1082,7 @@ class ObsForgeCycleProcessor:
                         f"  Execution: SUBMITTED to {scheduler} "
                         f"(Job ID: {job_id})"
                     )
-                    report_lines.append(exec_line)
+                    line(exec_line)
                 elif status == "completed":
                     return_code = execution.get(
                         "return_code", "unknown"
@@ -794,7 +1091,7 @@ class ObsForgeCycleProcessor:
                         "  Execution: COMPLETED (bash, return code: "
                         f"{return_code})"
                     )
-                    report_lines.append(exec_line)
+                    line(exec_line)
                 elif status == "failed":
                     error = execution.get(
                         "error", "Unknown error"
@@ -802,25 +1099,25 @@ class ObsForgeCycleProcessor:
                     exec_line = (
                         f"  Execution: FAILED ({execution_mode}) - {error}"
                     )
-                    report_lines.append(exec_line)
+                    line(exec_line)
                 elif status == "skipped":
                     reason = execution.get(
                         "reason", "Unknown reason"
                     )
-                    report_lines.append(
+                    line(
                         f"  Execution: SKIPPED - {reason}"
                     )
                 else:
-                    report_lines.append(
+                    line(
                         f"  Execution: {status.upper()}"
                     )
             else:
-                report_lines.append("  Execution: Not executed")
+                line("  Execution: Not executed")
 
-            report_lines.append("")  # Blank line between cycles
+            line("")  # Blank line between cycles
 
-        report_lines.append("=" * 80)
-        return "\n".join(report_lines)
+        line("=" * 80)
+        return buf.getvalue()
 
     def write_separated_status_reports(
         self, summary: Dict[str, Any], output_dir: Path
@@ -837,15 +1134,21 @@ class ObsForgeCycleProcessor:
             )
             return
 
-        # Split cycles by type
-        gdas_cycles = [
-            c for c in cycles if c.get("cycle", "").startswith("gdas.")
-        ]
-        gfs_cycles = [
-            c for c in cycles if c.get("cycle", "").startswith("gfs.")
-        ]
-
-        def format_cycle_report(cycle_data: Dict[str, Any]) -> str:
+        # Split cycles by type in one pass
+        gdas_cycles: List[Dict[str, Any]] = []
+        gfs_cycles: List[Dict[str, Any]] = []
+        for c in cycles:
+            cycle_name = c.get("cycle", "")
+            if cycle_name.startswith("gdas."):
+                gdas_cycles.append(c)
+            elif cycle_name.startswith("gfs."):
+                gfs_cycles.append(c)
+
+        def write_cycle_report(
+            cycle_data: Dict[str, Any], out: TextIO
+        ) -> None:
+            # Lines stream straight into the open report file instead
+            # of being collected and joined per cycle
             cycle_name = cycle_data.get("cycle", "Unknown")
             observations = cycle_data.get("observations", {})
             jcb_types = cycle_data.get("jcb_types", [])
@@ -855,41 +1158,44 @@ class ObsForgeCycleProcessor:
                 cycle_data, execution
             )
 
-            lines: List[str] = []
-            lines.append("---\n")
-            lines.append(f"### {cycle_status_icon} {cycle_name}")
+            def line(text: str) -> None:
+                out.write(text)
+                out.write("\n")
+
+            line("---\n")
+            line(f"### {cycle_status_icon} {cycle_name}")
             if observations:
-                lines.append("**Observations Found:**")
+                line("**Observations Found:**")
                 for obs_type, files in observations.items():
-                    lines.append(
+                    line(
                         f"- {obs_type.upper()}: {len(files)} files"
                     )
                     for file in files:
-                        lines.append(f"    - {file}")
+                        line(f"    - {file}")
             else:
-                lines.append("**Observations Found:** None")
+                line("**Observations Found:** None")
             if jcb_types:
-                lines.append("**JCB Types for Assimilation:**")
+                line("**JCB Types for Assimilation:**")
                 for jcb_type in jcb_types:
-                    lines.append(f"- {jcb_type}")
+                    line(f"- {jcb_type}")
             else:
-                lines.append(
+                line(
                     "**JCB Types for Assimilation:** None"
                 )
             if job_card:
-                job_name = Path(job_card).name
-                lines.append(
+                job_name = os.path.basename(job_card)
+                line(
                     f"**Job Card:** Generated ({job_name})"
                 )
             else:
-                lines.append(
+                line(
                     "**Job Card:** Not generated (no observations)"
                 )
             # Status log presence
             if cycle_data.get("status_log_missing"):
-                lines.append("**Status Log:** Missing")
+                line("**Status Log:** Missing")
             else:
-                lines.append("**Status Log:** Present")
+                line("**Status Log:** Present")
             if execution:
                 status = execution.get("status", "unknown")
                 execution_mode = execution.get(
@@ -905,7 +1211,7 @@ class ObsForgeCycleProcessor:
                         scheduler = "PBS"
                     else:
                         scheduler = execution_mode.upper()
-                    lines.append(
+                    line(
                         f"**Execution:** SUBMITTED to {scheduler} "
                         f"(Job ID: {job_id})"
                     )
@@ -913,7 +1219,7 @@ class ObsForgeCycleProcessor:
                     return_code = execution.get(
                         "return_code", "unknown"
                     )
-                    lines.append(
+                    line(
                         "**Execution:** COMPLETED (bash, return code: "
                         f"{return_code})"
                     )
@@ -921,38 +1227,39 @@ class ObsForgeCycleProcessor:
                     error = execution.get(
                         "error", "Unknown error"
                     )
-                    lines.append(
+                    line(
                         f"**Execution:** FAILED ({execution_mode}) - {error}"
                     )
                 elif status == "skipped":
                     reason = execution.get(
                         "reason", "Unknown reason"
                     )
-                    lines.append(
+                    line(
                         f"**Execution:** SKIPPED - {reason}"
                     )
                 else:
-                    lines.append(
+                    line(
                         f"**Execution:** {status.upper()}"
                     )
             else:
-                lines.append("**Execution:** Not executed")
-            lines.append("")
-            return "\n".join(lines)
+                line("**Execution:** Not executed")
 
         def write_report(
             cycles_list: List[Dict[str, Any]], filename: str, title: str
         ) -> None:
             report_path = output_dir / filename
-            with open(report_path, "w") as f:
+            # Wide buffer so the streamed report reaches the kernel in
+            # a handful of writes; itemgetter sorts without a Python
+            # frame per comparison
+            with open(report_path, "w", buffering=1 << 20) as f:
                 f.write(f"# {title}\n\n")
                 if not cycles_list:
                     f.write("No cycles processed.\n")
                 else:
                     for cycle_data in sorted(
-                        cycles_list, key=lambda x: x.get("cycle", "")
+                        cycles_list, key=itemgetter("cycle")
                     ):
-                        f.write(format_cycle_report(cycle_data))
+                        write_cycle_report(cycle_data, f)
             self.logger.info(
                 f"Status report written to {report_path}"
             )
@@ -1084,40 +1391,29 @@ class ObsForgeCycleProcessor:
         Get visual status icon for a cycle based on its processing and
         execution status.
         """
-        # ANSI color codes
-        GREEN = "\033[92m"  # Bright green
-        YELLOW = "\033[93m"  # Bright yellow
-        RESET = "\033[0m"  # Reset to default color
-
         # Treat missing status log as failure
         if cycle_data.get("status_log_missing"):
-            return "❌"
+            return _ICON_FAILED
         # Check if cycle was processed successfully
         has_observations = bool(cycle_data.get("observations", {}))
         job_card_generated = cycle_data.get("job_card") is not None
 
         # If no observations, it's a failed cycle
         if not has_observations:
-            return "❌"
+            return _ICON_FAILED
         # If observations exist but no job card, something went wrong
         if has_observations and not job_card_generated:
-            return "❌"
+            return _ICON_FAILED
 
         # Check execution status if available
         if execution:
-            exec_status = execution.get("status", "unknown")
-            if exec_status == "completed":
-                return "✅"
-            elif exec_status == "submitted":
-                return "⏳"
-            elif exec_status == "failed":
-                return "❌"
-            elif exec_status == "skipped":
-                return f"{YELLOW}○{RESET}"
+            icon = _EXEC_ICONS.get(execution.get("status", "unknown"))
+            if icon is not None:
+                return icon
 
         # If no execution info but job card was generated successfully
         if job_card_generated:
-            return f"{GREEN}✓{RESET}"
+            return _ICON_GENERATED
 
         # Default to neutral
-        return f"{YELLOW}○{RESET}"
+        return _ICON_NEUTRAL
@@ -1,10 +1,72 @@
 from __future__ import annotations
 
+import functools
+import os
+import pickle
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Module-level default logger; getLogger takes a global lock, so
+# resolve it once instead of per scanner construction
+_LOGGER = logging.getLogger(__name__)
+
+# Compiled once at import; find_cycles applies it to every directory
+# entry under the obsForge root.
+_CYCLE_RE = re.compile(r"^(gfs|gdas)\.(\d{8})$")
+
+# Upper bound on concurrent directory probes; the scans are
+# latency-bound on networked filesystems and the GIL is released
+# across each scandir syscall. Oversubscribe the cores since the
+# threads spend their time waiting on metadata RPCs, capped so a huge
+# cycle range cannot spawn hundreds of threads.
+_MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Date ranges narrower than this are resolved by probing the known
+# candidate directory names directly rather than listing the root
+_DIRECT_PROBE_DAYS = 30
+
+# Known observation-type subdirectories of an ocean directory, in the
+# canonical order results are reported in
+_OBS_TYPES = ("adt", "icec", "sss", "sst", "insitu")
+_OBS_TYPE_ORDER = {name: i for i, name in enumerate(_OBS_TYPES)}
+
+
+@functools.lru_cache(maxsize=32)
+def _prepared_bounds(
+    start_date: Optional[str], end_date: Optional[str]
+) -> Tuple[Optional[datetime], Optional[int]]:
+    """
+    Validated (start_dt, range_days) for a date-bound pair.
+
+    Callers that iterate find_cycles over the same range pay the
+    strptime setup once; invalid bounds raise ValueError every call
+    since exceptions are not cached.
+    """
+    start_dt: Optional[datetime] = None
+    range_days: Optional[int] = None
+    if start_date:
+        start_dt = datetime.strptime(start_date, "%Y%m%d")
+        if end_date:
+            end_dt = datetime.strptime(end_date, "%Y%m%d")
+            range_days = (end_dt - start_dt).days
+    elif end_date:
+        datetime.strptime(end_date, "%Y%m%d")
+    return start_dt, range_days
+
+
+def _cycle_sort_key(cycle: Tuple[str, str, str]) -> Tuple[bool, int, int]:
+    """
+    Integer sort key for (cycle_type, date, hour) tuples.
+
+    Ints compare in plain C instead of the per-character string rich
+    comparison, and gdas deterministically sorts before gfs.
+    """
+    cycle_type, date, hour = cycle
+    return (cycle_type != "gdas", int(date), int(hour))
 
 
 class ObsForgeScanner:
@@ -14,6 +76,7 @@ class ObsForgeScanner:
         self,
         obsforge_comroot: str,
         logger: Optional[logging.Logger] = None,
+        cache_file: Optional[str] = None,
     ):
         """
         Initialize the scanner.
@@ -22,16 +85,50 @@ class ObsForgeScanner:
             obsforge_comroot: Path to obsForge root directory containing
                 gfs.YYYYMMDD and gdas.YYYYMMDD directories
             logger: Optional logger instance
+            cache_file: Optional pickle file holding observation scan
+                results from a previous run; entries are reused as long
+                as the cycle directory mtimes are unchanged
         """
         self.obsforge_comroot = Path(obsforge_comroot)
         self.obsforge_root = self.obsforge_comroot
-        self.logger = logger or logging.getLogger(__name__)
+        # Plain-string root for hot paths; os.path.join on strings
+        # avoids a Path allocation per directory probed
+        self._root_str = str(self.obsforge_root)
+        self.logger = logger if logger is not None else _LOGGER
 
         if not self.obsforge_root.exists():
             raise FileNotFoundError(
                 f"ObsForge directory not found: {self.obsforge_root}"
             )
 
+        # Scan results keyed by ocean-dir path; each entry carries the
+        # mtime stamp it was taken under, so re-runs over an unchanged
+        # cycle cost a handful of stats instead of a full listing
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._obs_cache: Dict[
+            str, Tuple[Tuple, Dict[str, Tuple[str, ...]]]
+        ] = {}
+        if self.cache_file is not None:
+            try:
+                with open(self.cache_file, "rb") as f:
+                    self._obs_cache = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                self._obs_cache = {}
+
+    def clear_cache(self) -> None:
+        """Drop cached scan results, forcing fresh directory listings."""
+        self._obs_cache.clear()
+
+    def save_cache(self) -> None:
+        """Persist the observation scan cache for the next run."""
+        if self.cache_file is None:
+            return
+        try:
+            with open(self.cache_file, "wb") as f:
+                pickle.dump(self._obs_cache, f)
+        except OSError as e:
+            self.logger.warning(f"Could not write scan cache: {e}")
+
     def find_cycles(
         self,
         cycle_types: List[str] = ["gfs", "gdas"],
@@ -51,10 +148,168 @@ class ObsForgeScanner:
             List of tuples (cycle_type, date, hour)
         """
         cycles: List[Tuple[str, str, str]] = []
+        candidates = list(
+            self._iter_candidates(cycle_types, start_date, end_date)
+        )
+
+        # Probe the per-cycle hour directories concurrently to hide
+        # per-scandir latency
+        if len(candidates) > 1:
+            max_workers = min(_MAX_SCAN_WORKERS, len(candidates))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for found in executor.map(self._scan_hours, candidates):
+                    cycles.extend(found)
+        else:
+            for candidate in candidates:
+                cycles.extend(self._scan_hours(candidate))
+
+        return sorted(cycles, key=_cycle_sort_key)
+
+    def iter_cycles(
+        self,
+        cycle_types: List[str] = ["gfs", "gdas"],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[Tuple[str, str, str]]:
+        """
+        Yield cycles as they are discovered, in directory order.
+
+        Lazy serial counterpart of find_cycles: nothing past the
+        caller's stopping point is scanned, so probing for the first
+        matching cycle does not pay for the whole tree walk. Results
+        are unsorted; use find_cycles for the sorted full list.
+
+        Args:
+            cycle_types: List of cycle types to include ('gfs', 'gdas')
+            start_date: Start date in YYYYMMDD format (inclusive)
+            end_date: End date in YYYYMMDD format (inclusive)
+
+        Yields:
+            (cycle_type, date, hour) tuples
+        """
+        for candidate in self._iter_candidates(
+            cycle_types, start_date, end_date
+        ):
+            yield from self._scan_hours(candidate)
+
+    def _iter_candidates(
+        self,
+        cycle_types: List[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> Iterator[Tuple[str, str, str]]:
+        """Yield (cycle_type, date, path) for matching cycle dirs."""
+        # Two booleans instead of a set: the allowed types can only
+        # ever be gfs/gdas, so rejection in the per-entry branches
+        # below is a plain load rather than a hash lookup
+        want_gfs = "gfs" in cycle_types
+        want_gdas = "gdas" in cycle_types
+
+        # Validate the bounds once per distinct range; the
+        # per-directory filter then compares the fixed-width YYYYMMDD
+        # strings directly, which orders chronologically without a
+        # strptime per entry
+        start_dt, range_days = _prepared_bounds(start_date, end_date)
+
+        if range_days is not None and 0 <= range_days < _DIRECT_PROBE_DAYS:
+            # Narrow range: the candidate directory names are known, so
+            # probe them with isdir instead of listing a root that may
+            # hold thousands of dated directories
+            for offset in range(range_days + 1):
+                date = (
+                    start_dt + timedelta(days=offset)
+                ).strftime("%Y%m%d")
+                for cycle_type, wanted in (
+                    ("gfs", want_gfs), ("gdas", want_gdas)
+                ):
+                    if not wanted:
+                        continue
+                    path = os.path.join(
+                        self._root_str, f"{cycle_type}.{date}"
+                    )
+                    if os.path.isdir(path):
+                        yield cycle_type, date, path
+        else:
+            # os.scandir reuses the entry type reported by the
+            # directory listing itself, avoiding a stat per entry
+            with os.scandir(self.obsforge_root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+
+                    # Plain prefix/length checks; cheaper than running
+                    # the regex machinery on every directory entry
+                    name = entry.name
+                    if name.startswith("gfs."):
+                        if not want_gfs:
+                            continue
+                        cycle_type, date = "gfs", name[4:]
+                    elif name.startswith("gdas."):
+                        if not want_gdas:
+                            continue
+                        cycle_type, date = "gdas", name[5:]
+                    else:
+                        continue
+                    if len(date) != 8 or not date.isdigit():
+                        continue
+
+                    # Filter by date range if specified, before the
+                    # inner hour-directory scan ever runs
+                    if start_date and date < start_date:
+                        continue
+                    if end_date and date > end_date:
+                        continue
+
+                    yield cycle_type, date, entry.path
+
+    @staticmethod
+    def _scan_hours(
+        candidate: Tuple[str, str, str]
+    ) -> List[Tuple[str, str, str]]:
+        """Look for hour subdirectories of one cycle directory."""
+        cycle_type, date, path = candidate
+        # Single comprehension over the scandir iterator; the
+        # cheap name check runs before the is_dir entry-type test.
+        # Hour directories are normally two digits already, so
+        # zfill (and its string allocation) only runs for the
+        # rare single-digit name
+        with os.scandir(path) as hour_entries:
+            return [
+                (
+                    cycle_type,
+                    date,
+                    hour_entry.name
+                    if len(hour_entry.name) == 2
+                    else hour_entry.name.zfill(2),
+                )
+                for hour_entry in hour_entries
+                if hour_entry.name.isdigit() and hour_entry.is_dir()
+            ]
+
+    def scan_all(
+        self,
+        cycle_types: List[str] = ["gfs", "gdas"],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[Tuple[str, str, str], Dict[str, Tuple[str, ...]]]:
+        """
+        Scan the whole obsForge tree in a single pruned walk.
+
+        Equivalent to find_cycles plus scan_cycle_observations for each
+        cycle, but the tree is traversed once instead of once per
+        cycle.
+
+        Args:
+            cycle_types: List of cycle types to include ('gfs', 'gdas')
+            start_date: Start date in YYYYMMDD format (inclusive)
+            end_date: End date in YYYYMMDD format (inclusive)
+
+        Returns:
+            Dictionary mapping (cycle_type, date, hour) tuples to the
+            observations dict for that cycle
+        """
         cycle_types_set = set(cycle_types)
-        cycle_pattern = re.compile(r"^(gfs|gdas)\.(\d{8})$")
 
-        # Convert date strings to datetime objects for comparison
         start_dt = (
             datetime.strptime(start_date, "%Y%m%d") if start_date else None
         )
@@ -62,36 +317,172 @@ class ObsForgeScanner:
             datetime.strptime(end_date, "%Y%m%d") if end_date else None
         )
 
-        for cycle_dir in self.obsforge_root.iterdir():
-            if not cycle_dir.is_dir():
-                continue
+        results: Dict[
+            Tuple[str, str, str], Dict[str, Tuple[str, ...]]
+        ] = {}
+        root = str(self.obsforge_root)
+        root_depth = root.rstrip(os.sep).count(os.sep)
 
-            match = cycle_pattern.match(cycle_dir.name)
-            if not match:
-                continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            depth = dirpath.rstrip(os.sep).count(os.sep) - root_depth
 
-            cycle_type, date = match.groups()
-            if cycle_type not in cycle_types_set:
-                continue
+            if depth == 0:
+                # Keep only matching cycle directories
+                keep = []
+                for name in dirnames:
+                    match = _CYCLE_RE.match(name)
+                    if not match:
+                        continue
+                    cycle_type, date = match.groups()
+                    if cycle_type not in cycle_types_set:
+                        continue
+                    date_dt = datetime.strptime(date, "%Y%m%d")
+                    if start_dt and date_dt < start_dt:
+                        continue
+                    if end_dt and date_dt > end_dt:
+                        continue
+                    keep.append(name)
+                dirnames[:] = keep
+            elif depth == 1:
+                # Hour directories define the cycles
+                dirnames[:] = [d for d in dirnames if d.isdigit()]
+                cycle_type, date = os.path.basename(dirpath).split(".")
+                for hour_name in dirnames:
+                    if len(hour_name) != 2:
+                        hour_name = hour_name.zfill(2)
+                    key = (cycle_type, date, hour_name)
+                    results.setdefault(key, {})
+            elif depth == 2:
+                dirnames[:] = [d for d in dirnames if d == "ocean"]
+            elif depth == 3:
+                dirnames[:] = [
+                    d for d in dirnames if d in _OBS_TYPE_ORDER
+                ]
+            elif depth == 4:
+                dirnames[:] = []  # do not descend further
+                parts = dirpath[len(root):].strip(os.sep).split(os.sep)
+                cycle_dir, hour_name, _, obs_type = parts
+                cycle_type, date = cycle_dir.split(".")
+                file_names = tuple(
+                    f for f in filenames if f.endswith(".nc")
+                )
+                if file_names:
+                    if len(hour_name) != 2:
+                        hour_name = hour_name.zfill(2)
+                    key = (cycle_type, date, hour_name)
+                    results.setdefault(key, {})[obs_type] = file_names
 
-            # Filter by date range if specified
-            date_dt = datetime.strptime(date, "%Y%m%d")
-            if start_dt and date_dt < start_dt:
-                continue
-            if end_dt and date_dt > end_dt:
-                continue
+        return results
 
-            # Look for hour subdirectories
-            for hour_dir in cycle_dir.iterdir():
-                if hour_dir.is_dir() and hour_dir.name.isdigit():
-                    hour = hour_dir.name.zfill(2)
-                    cycles.append((cycle_type, date, hour))
+    def prefilter_nonempty(
+        self, cycles: List[Tuple[str, str, str]]
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Keep only cycles whose ocean tree holds at least one .nc file.
 
-        return sorted(cycles)
+        One scandir per obs-type directory, stopping at the first hit,
+        is negligible next to the template pipeline an empty cycle
+        would otherwise be pushed through.
+
+        Args:
+            cycles: (cycle_type, date, hour) tuples to filter
+
+        Returns:
+            The input cycles that have at least one observation file
+        """
+        kept: List[Tuple[str, str, str]] = []
+        for cycle in cycles:
+            cycle_type, date, hour = cycle
+            ocean = os.path.join(
+                self._root_str, f"{cycle_type}.{date}", hour, "ocean"
+            )
+            for obs_type in _OBS_TYPES:
+                try:
+                    with os.scandir(
+                        os.path.join(ocean, obs_type)
+                    ) as entries:
+                        if any(
+                            entry.name.endswith(".nc")
+                            for entry in entries
+                        ):
+                            kept.append(cycle)
+                            break
+                except OSError:
+                    continue
+        return kept
+
+    def scan_many_cycles(
+        self,
+        cycles: List[Tuple[str, str, str]],
+        max_workers: int = 16,
+    ) -> Dict[Tuple[str, str, str], Dict[str, Tuple[str, ...]]]:
+        """
+        Scan observations for many cycles concurrently.
+
+        The per-cycle scans are independent directory syscalls that
+        release the GIL, so issuing them from a thread pool hides the
+        per-scandir latency when iterating a long cycle list.
+
+        Args:
+            cycles: (cycle_type, date, hour) tuples to scan
+            max_workers: Upper bound on concurrent cycle scans
+
+        Returns:
+            Dictionary mapping each cycle tuple to its observations
+            dict, as returned by scan_cycle_observations
+        """
+        if len(cycles) <= 1:
+            return {
+                cycle: self.scan_cycle_observations(*cycle)
+                for cycle in cycles
+            }
+        workers = min(max_workers, len(cycles))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda cycle: self.scan_cycle_observations(*cycle),
+                cycles,
+            )
+            return dict(zip(cycles, results))
+
+    def iter_cycle_observations(
+        self, cycle_type: str, date: str, hour: str
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (obs_type, file_name) pairs for one cycle, lazily.
+
+        Streams entries straight off the directory listings without
+        materializing the per-type lists, so a caller that only needs
+        the first few files never lists the rest. Bypasses the mtime
+        cache; use scan_cycle_observations for the cached dict form.
+
+        Args:
+            cycle_type: 'gfs' or 'gdas'
+            date: Date in YYYYMMDD format
+            hour: Hour in HH format
+
+        Yields:
+            (obs_type, file_name) tuples in directory order
+        """
+        cycle_path = os.path.join(
+            self._root_str, f"{cycle_type}.{date}", hour, "ocean"
+        )
+        for obs_type in _OBS_TYPES:
+            try:
+                with os.scandir(
+                    os.path.join(cycle_path, obs_type)
+                ) as entries:
+                    for entry in entries:
+                        if (
+                            entry.name.endswith(".nc")
+                            and entry.is_file()
+                        ):
+                            yield obs_type, entry.name
+            except OSError:
+                continue
 
     def scan_cycle_observations(
         self, cycle_type: str, date: str, hour: str
-    ) -> Dict[str, List[str]]:
+    ) -> Dict[str, Tuple[str, ...]]:
         """
         Scan a specific cycle for available observations.
 
@@ -101,36 +492,86 @@ class ObsForgeScanner:
             hour: Hour in HH format
 
         Returns:
-            Dictionary mapping observation types to lists of available files
+            Dictionary mapping observation types to tuples of
+            available file names
         """
-        cycle_path = (
-            self.obsforge_root / f"{cycle_type}.{date}" / hour / "ocean"
+        cycle_path = os.path.join(
+            self._root_str, f"{cycle_type}.{date}", hour, "ocean"
         )
 
-        if not cycle_path.exists():
+        observations: Dict[str, Tuple[str, ...]] = {}
+
+        # One listing of the ocean dir discovers which obs-type
+        # subdirs are actually present, so absent types cost nothing
+        # beyond this single scandir. A missing ocean dir surfaces as
+        # OSError here without a separate exists() probe
+        try:
+            ocean_mtime = os.stat(cycle_path).st_mtime_ns
+            with os.scandir(cycle_path) as entries:
+                subdirs = [
+                    entry
+                    for entry in entries
+                    if entry.name in _OBS_TYPE_ORDER and entry.is_dir()
+                ]
+        except OSError:
             self.logger.warning(
                 f"Ocean directory not found: {cycle_path}"
             )
             return {}
+        subdirs.sort(key=lambda entry: _OBS_TYPE_ORDER[entry.name])
 
-        observations: Dict[str, List[str]] = {}
-
-        # Scan known observation type directories
-        obs_types = ["adt", "icec", "sss", "sst", "insitu"]
-
-        for obs_type in obs_types:
-            obs_dir = cycle_path / obs_type
-            if obs_dir.exists():
-                # Find all .nc files in this directory
-                nc_files = list(obs_dir.glob("*.nc"))
-                if nc_files:
-                    file_names = [f.name for f in nc_files]
-                    observations[obs_type] = file_names
-                    msg = (
-                        "Found "
-                        f"{len(nc_files)} {obs_type} files for "
-                        f"{cycle_type}.{date}.{hour}"
+        # Reuse the cached result when the ocean dir and its present
+        # obs-type subdirectories carry the same mtimes as when the
+        # entry was taken
+        stamp = (
+            ocean_mtime,
+            tuple(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in subdirs
+            ),
+        )
+        cached = self._obs_cache.get(cycle_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        def probe(subdir: os.DirEntry) -> Tuple[str, Tuple[str, ...]]:
+            """Find all .nc files for one observation type."""
+            # Tuples skip the list-growth path and read-only callers
+            # never mutate the result anyway
+            try:
+                with os.scandir(subdir.path) as entries:
+                    file_names = tuple(
+                        entry.name
+                        for entry in entries
+                        if entry.name.endswith(".nc") and entry.is_file()
                     )
-                    self.logger.info(msg)
+            except OSError:
+                return subdir.name, ()
+            return subdir.name, file_names
+
+        # The per-type probes are pure I/O; run them concurrently and
+        # collect into the dict (and log) on the calling thread
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=len(subdirs)) as executor:
+                probed = list(executor.map(probe, subdirs))
+        else:
+            probed = [probe(subdir) for subdir in subdirs]
+        for obs_type, file_names in probed:
+            if file_names:
+                observations[obs_type] = file_names
+
+        # One log line per cycle instead of one per obs type; the
+        # guard also skips building the summary when INFO is off, and
+        # %-style arguments defer formatting to the handler
+        if observations and self.logger.isEnabledFor(logging.INFO):
+            summary = ",".join(
+                f"{obs_type}={len(file_names)}"
+                for obs_type, file_names in observations.items()
+            )
+            self.logger.info(
+                "Found obs for %s.%s.%s: %s",
+                cycle_type, date, hour, summary,
+            )
 
+        self._obs_cache[cycle_path] = (stamp, observations)
         return observations
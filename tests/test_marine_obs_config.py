@@ -8,18 +8,72 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from marine_obs_config import MarineObsConfigGenerator, JCBGDASTemplateManager
 
+# Build fixtures on tmpfs when the platform offers it; the files are
+# discarded after the run, so skipping disk writeback is free speed
+_TMP_BASE = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def _write_template(path, data):
+    """Write a small fixture file in a single syscall.
+
+    Skips the TextIOWrapper and encoder setup of open(); the
+    templates are tiny, so one os.write always completes.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+# Fixture payloads encoded once at import; setUpClass then moves
+# bytes straight to the write syscall with no per-file codec work
+_MOCK_JCB_TEMPLATE = b"# Mock JCB template\nobservation: {{ obs_type }}"
+
+_MOCK_3DVAR_TEMPLATE = b"""
+cost_function:
+  cost_type: 3D-Var
+  window_begin: "{{ window_begin | default('2024-01-01T00:00:00Z') }}"
+  observations:
+    observers:
+{% for obs_config in obs_configs %}
+{{ obs_config | indent(6, True) }}
+{% endfor %}
+output:
+  filename: "{{ output_filename | default('test_analysis.nc') }}"
+"""
+
+_MOCK_OBSERVER_TEMPLATE = b"""
+# Mock JCB template for {{ observation_from_jcb }}
+observations:
+  observers:
+  - obs space:
+      name: "{{ observation_from_jcb }}"
+      obsdatain:
+        engine:
+          type: H5File
+          obsfile: "mock_{{ observation_from_jcb }}.nc"
+      simulated variables: [mock_variable]
+    obs operator:
+      name: Identity
+    obs error:
+      covariance model: diagonal
+"""
+
 
 class TestJCBGDASTemplateManager(unittest.TestCase):
     """Test cases for the JCBGDASTemplateManager class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.jcb_path = os.path.join(self.temp_dir, 'jcb-gdas')
-        self.marine_path = os.path.join(
-            self.jcb_path, 'observations', 'marine'
+    @classmethod
+    def setUpClass(cls):
+        """Create the read-only template fixtures once per class."""
+        cls._temp_ctx = tempfile.TemporaryDirectory(dir=_TMP_BASE)
+        cls.temp_dir = cls._temp_ctx.name
+        cls.jcb_path = os.path.join(cls.temp_dir, 'jcb-gdas')
+        cls.marine_path = os.path.join(
+            cls.jcb_path, 'observations', 'marine'
         )
-        os.makedirs(self.marine_path)
+        os.makedirs(cls.marine_path)
 
         # Create mock template files
         template_files = [
@@ -30,14 +84,13 @@ class TestJCBGDASTemplateManager(unittest.TestCase):
         ]
 
         for template_file in template_files:
-            template_path = os.path.join(self.marine_path, template_file)
-            with open(template_path, 'w') as f:
-                f.write("# Mock JCB template\nobservation: {{ obs_type }}")
+            template_path = os.path.join(cls.marine_path, template_file)
+            _write_template(template_path, _MOCK_JCB_TEMPLATE)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared fixtures."""
+        cls._temp_ctx.cleanup()
 
     def test_initialization(self):
         """Test JCB manager initialization."""
@@ -49,11 +102,17 @@ class TestJCBGDASTemplateManager(unittest.TestCase):
         manager = JCBGDASTemplateManager(self.jcb_path)
         templates = manager.list_available_templates()
 
-        self.assertEqual(len(templates), 4)
-        self.assertIn('sst_viirs_npp_l3u', templates)
-        self.assertIn('sss_smap_l2', templates)
-        self.assertIn('insitu_temp_profile_argo', templates)
-        self.assertIn('rads_adt_3a', templates)
+        # One set comparison instead of a length check plus four
+        # membership scans; a mismatch also reports both sides whole
+        self.assertEqual(
+            {
+                'sst_viirs_npp_l3u',
+                'sss_smap_l2',
+                'insitu_temp_profile_argo',
+                'rads_adt_3a',
+            },
+            set(templates)
+        )
 
     def test_match_observation_exact(self):
         """Test exact observation type matching."""
@@ -87,78 +146,51 @@ class TestJCBGDASTemplateManager(unittest.TestCase):
 class TestMarineObsConfigGenerator(unittest.TestCase):
     """Test cases for the MarineObsConfigGenerator class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.jcb_path = os.path.join(self.temp_dir, 'jcb-gdas')
-        self.marine_path = os.path.join(
-            self.jcb_path, 'observations', 'marine'
+    @classmethod
+    def setUpClass(cls):
+        """Create the read-only template fixtures once per class."""
+        cls._temp_ctx = tempfile.TemporaryDirectory(dir=_TMP_BASE)
+        cls.temp_dir = cls._temp_ctx.name
+        cls.jcb_path = os.path.join(cls.temp_dir, 'jcb-gdas')
+        cls.marine_path = os.path.join(
+            cls.jcb_path, 'observations', 'marine'
         )
-        os.makedirs(self.marine_path)
+        os.makedirs(cls.marine_path)
 
         # Create mock templates directory
-        self.template_dir = os.path.join(self.temp_dir, 'templates')
-        os.makedirs(self.template_dir)
+        cls.template_dir = os.path.join(cls.temp_dir, 'templates')
+        os.makedirs(cls.template_dir)
 
         # Create mock 3DVAR template
-        template_3dvar_content = """
-cost_function:
-  cost_type: 3D-Var
-  window_begin: "{{ window_begin | default('2024-01-01T00:00:00Z') }}"
-  observations:
-    observers:
-{% for obs_config in obs_configs %}
-{{ obs_config | indent(6, True) }}
-{% endfor %}
-output:
-  filename: "{{ output_filename | default('test_analysis.nc') }}"
-"""
         template_3dvar_path = os.path.join(
-            self.template_dir, 'jedi_3dvar_template.yaml.j2'
+            cls.template_dir, 'jedi_3dvar_template.yaml.j2'
         )
-        with open(template_3dvar_path, 'w') as f:
-            f.write(template_3dvar_content)
+        _write_template(template_3dvar_path, _MOCK_3DVAR_TEMPLATE)
 
         # Create mock template files
-        template_content = """
-# Mock JCB template for {{ observation_from_jcb }}
-observations:
-  observers:
-  - obs space:
-      name: "{{ observation_from_jcb }}"
-      obsdatain:
-        engine:
-          type: H5File
-          obsfile: "mock_{{ observation_from_jcb }}.nc"
-      simulated variables: [mock_variable]
-    obs operator:
-      name: Identity
-    obs error:
-      covariance model: diagonal
-"""
-
         template_files = ['sst_viirs_npp_l3u.yaml.j2', 'sss_smap_l2.yaml.j2']
         for template_file in template_files:
-            template_path = os.path.join(self.marine_path, template_file)
-            with open(template_path, 'w') as f:
-                f.write(template_content)
-
-        self.generator = MarineObsConfigGenerator(
-            self.jcb_path,
-            self.template_dir
-        )
+            template_path = os.path.join(cls.marine_path, template_file)
+            _write_template(template_path, _MOCK_OBSERVER_TEMPLATE)
 
         # Test observations in different formats
-        self.test_obs_strings = ['sst_viirs_npp_l3u', 'sss_smap_l2']
-        self.test_obs_dicts = [
+        cls.test_obs_strings = ['sst_viirs_npp_l3u', 'sss_smap_l2']
+        cls.test_obs_dicts = [
             {'type': 'sst_viirs_npp_l3u'},
             {'type': 'sss_smap_l2'}
         ]
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared fixtures."""
+        cls._temp_ctx.cleanup()
+
+    def setUp(self):
+        """Construct a fresh generator; the templates are shared."""
+        self.generator = MarineObsConfigGenerator(
+            self.jcb_path,
+            self.template_dir
+        )
 
     def test_validate_observations_strings(self):
         """Test validation with string observation types."""